@@ -7,16 +7,19 @@ web frontends, Slack bots, Microsoft Teams, and other applications.
 Built with LangGraph for agent orchestration.
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Header, Request
+from fastapi import FastAPI, HTTPException, Depends, Header, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import Optional, Any
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Optional, Any, Mapping
+from types import MappingProxyType
+from contextlib import asynccontextmanager
 from datetime import datetime
 from sqlalchemy import text
 from sqlalchemy.exc import SQLAlchemyError
-import uvicorn
-import uuid
+import json
+import time
 from functools import lru_cache
 
 from hr_agent.agent.langgraph_agent import HRAgentLangGraph, run_hr_agent
@@ -25,8 +28,25 @@ from hr_agent.configs.config import settings
 from hr_agent.utils.security import rate_limiter, audit_logger, AuditAction
 from hr_agent.tracing.observability import logger, metrics
 from hr_agent.utils.errors import HRAgentError, RateLimitError
+from hr_agent.utils.decorators import cache_result
+from hr_agent.utils.ids import uuid7
 from hr_agent.repositories.employee import EmployeeRepository
+from hr_agent.repositories import get_session_repo
 from hr_agent.services import get_escalation_service, get_hr_request_service
+from hr_agent.utils.db import get_engine
+
+# SSE frames are emitted per streamed token; orjson serializes the small
+# delta payloads several times faster than stdlib json.
+try:
+    import orjson
+
+    def _dumps_sse(payload: dict) -> str:
+        return orjson.dumps(payload).decode()
+
+except ImportError:  # pragma: no cover - depends on environment
+
+    def _dumps_sse(payload: dict) -> str:
+        return json.dumps(payload)
 
 
 # ============================================================================
@@ -70,6 +90,11 @@ class SessionTurnRecord(BaseModel):
     timestamp: str
 
 
+# Built once: serializes the session list straight to dicts, skipping
+# FastAPI's per-item response_model validation pass.
+_session_list_adapter = TypeAdapter(list[SessionInfo])
+
+
 class UserContext(BaseModel):
     """User context information."""
 
@@ -355,7 +380,20 @@ class HRRequestActionResult(BaseModel):
 # FASTAPI APP
 # ============================================================================
 
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Initialize the database on startup (dev convenience only).
+
+    Production seeds once via `python -m hr_agent.seed` before launch,
+    so multiple workers don't race on DB initialization.
+    """
+    if settings.env != "prod":
+        seed_if_needed()
+    yield
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="HR Agent API",
     description="An intelligent HR assistant API powered by LangGraph",
     version="2.0.0",
@@ -374,37 +412,34 @@ app.add_middleware(
 
 
 # ============================================================================
-# SESSION STORAGE (In-memory for demo, use Redis in production)
+# SESSION STORAGE (DB-backed so sessions survive restarts and are shared
+# across uvicorn workers -- no sticky-session routing needed)
 # ============================================================================
 
-_sessions: dict[str, dict] = {}
+_session_repo = get_session_repo()
 
 
 def get_or_create_session(session_id: str | None, user_email: str) -> tuple[str, dict]:
     """Get or create a session for the user."""
-    if session_id and session_id in _sessions:
-        session = _sessions[session_id]
-        if session["user_email"] == user_email:
-            return session_id, session
+    if session_id:
+        session = _session_repo.get(session_id)
+        if session:
+            if session["user_email"] == user_email:
+                return session_id, session
+            # Another user's session: never adopt or overwrite it.
+            session_id = None
 
     # Create new session
-    new_session_id = session_id or str(uuid.uuid4())
-    _sessions[new_session_id] = {
-        "user_email": user_email,
-        "created_at": datetime.utcnow(),
-        "turns": [],
-        "pending_confirmation": None,
-    }
-    return new_session_id, _sessions[new_session_id]
+    new_session_id = session_id or str(uuid7())
+    return new_session_id, _session_repo.create(new_session_id, user_email)
 
 
-def build_session_title(session: dict) -> Optional[str]:
+def build_session_title(first_query: Optional[str]) -> Optional[str]:
     """Return a concise session title from the first user query."""
-    for turn in session.get("turns", []):
-        query = str(turn.get("query", "")).strip()
-        if query:
-            condensed = " ".join(query.split())
-            return f"{condensed[:48]}..." if len(condensed) > 48 else condensed
+    query = (first_query or "").strip()
+    if query:
+        condensed = " ".join(query.split())
+        return f"{condensed[:48]}..." if len(condensed) > 48 else condensed
     return None
 
 
@@ -416,8 +451,10 @@ def build_session_title(session: dict) -> Optional[str]:
 @app.middleware("http")
 async def request_middleware(request: Request, call_next):
     """Add request tracking, logging, and rate limiting."""
-    request_id = str(uuid.uuid4())
-    start_time = datetime.utcnow()
+    request_id = str(uuid7())
+    # Monotonic integer clock: no datetime/timedelta allocation per
+    # request, and immune to wall-clock adjustments.
+    start_ns = time.perf_counter_ns()
 
     # Set request context for logging
     logger.set_context(request_id=request_id)
@@ -433,7 +470,7 @@ async def request_middleware(request: Request, call_next):
         response = await call_next(request)
 
         # Calculate duration
-        duration_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Log response
         logger.info(
@@ -526,7 +563,14 @@ def _raise_hr_request_http_error(message: str, default_status: int = 400) -> Non
 # ============================================================================
 
 
-def get_requester_context(user_email: str) -> dict:
+# Every authenticated request resolves the requester's context, which
+# costs employee + direct-report + role lookups. A short TTL keeps a
+# chatty frontend from paying that DB round-trip per call while bounding
+# staleness of role/report changes to a minute. Unknown users raise and
+# are never cached. The mapping proxy keeps handlers from mutating the
+# shared cache entry.
+@cache_result(ttl_seconds=60, max_entries=1024)
+def get_requester_context(user_email: str) -> Mapping:
     """Get the context for the requesting user."""
     employee_repo = EmployeeRepository()
     employee = employee_repo.get_by_email(user_email)
@@ -534,17 +578,20 @@ def get_requester_context(user_email: str) -> dict:
     if not employee:
         raise ValueError(f"User {user_email} not found")
 
-    direct_reports = employee_repo.get_direct_reports(employee["employee_id"])
-
-    return {
-        "employee_id": employee["employee_id"],
-        "user_email": employee["email"],
-        "name": employee["preferred_name"] or employee.get("legal_name", "Unknown"),
-        "role": employee_repo.get_role_by_email(user_email),
-        "department": employee["department"],
-        "direct_reports": [r["employee_id"] for r in direct_reports],
-        "is_manager": len(direct_reports) > 0,
-    }
+    # Only the count is needed downstream; don't materialize report rows.
+    direct_reports_count = employee_repo.count_direct_reports(employee["employee_id"])
+
+    return MappingProxyType(
+        {
+            "employee_id": employee["employee_id"],
+            "user_email": employee["email"],
+            "name": employee["preferred_name"] or employee.get("legal_name", "Unknown"),
+            "role": employee_repo.get_role_by_email(user_email),
+            "department": employee["department"],
+            "direct_reports_count": direct_reports_count,
+            "is_manager": direct_reports_count > 0,
+        }
+    )
 
 
 @lru_cache(maxsize=1)
@@ -562,7 +609,7 @@ def get_allowed_test_user_emails() -> set[str]:
 
 async def get_current_user(
     request: Request, x_user_email: str = Header(..., alias="X-User-Email")
-) -> dict:
+) -> Mapping:
     """
     Extract the current user from the request header.
     With rate limiting and audit logging.
@@ -581,7 +628,8 @@ async def get_current_user(
         raise RateLimitError("API", retry_after=60)
 
     try:
-        context = get_requester_context(normalized_email)
+        # Synchronous DB lookups run off the event loop.
+        context = await run_in_threadpool(get_requester_context, normalized_email)
 
         # Audit login/access
         audit_logger.log(
@@ -600,15 +648,6 @@ async def get_current_user(
         ) from e
 
 
-# ============================================================================
-# STARTUP EVENT
-# ============================================================================
-
-
-@app.on_event("startup")
-async def startup_event():
-    """Initialize the database on startup."""
-    seed_if_needed()
 
 
 # ============================================================================
@@ -628,12 +667,12 @@ async def health_check():
 @app.get("/me", response_model=UserContext, tags=["User"])
 async def get_my_info(user: dict = Depends(get_current_user)):
     """Get the current user's context information."""
-    return UserContext(
+    return UserContext.model_construct(
         employee_id=user["employee_id"],
         name=user["name"],
         email=user["user_email"],
         role=user["role"],
-        direct_reports_count=len(user.get("direct_reports", [])),
+        direct_reports_count=user.get("direct_reports_count", 0),
     )
 
 
@@ -646,26 +685,27 @@ async def chat(request: ChatRequest, user: dict = Depends(get_current_user)):
     Uses LangGraph for agent orchestration.
     """
     try:
-        session_id, session = get_or_create_session(
-            request.session_id, user["user_email"]
+        # Session reads/writes hit the DB synchronously, so keep them off
+        # the event loop along with the agent itself.
+        session_id, session = await run_in_threadpool(
+            get_or_create_session, request.session_id, user["user_email"]
         )
 
-        # Run the LangGraph agent
-        response = run_hr_agent(
+        # Run the LangGraph agent in the threadpool: it blocks on the LLM
+        # and on synchronous DB access, and would otherwise stall the
+        # event loop for every concurrent request.
+        response = await run_in_threadpool(
+            run_hr_agent,
             user_email=user["user_email"],
             question=request.message,
         )
 
         # Store the turn
-        session["turns"].append(
-            {
-                "query": request.message,
-                "response": response,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+        await run_in_threadpool(
+            _session_repo.append_turn, session_id, request.message, response
         )
 
-        return ChatResponse(
+        return ChatResponse.model_construct(
             response=response,
             session_id=session_id,
             timestamp=datetime.now().isoformat(),
@@ -674,15 +714,54 @@ async def chat(request: ChatRequest, user: dict = Depends(get_current_user)):
         raise HTTPException(status_code=500, detail=f"Agent error: {str(e)}") from e
 
 
+@app.get("/chat/stream", tags=["Chat"])
+async def chat_stream(
+    message: str,
+    session_id: Optional[str] = None,
+    user: dict = Depends(get_current_user),
+):
+    """
+    Stream the agent's response as Server-Sent Events.
+
+    Time-to-first-byte drops to the model's first-token latency instead
+    of the full generation, and the connection no longer buffers the
+    whole reply. GET with query params so browser EventSource works.
+    """
+    resolved_session_id, _session = await run_in_threadpool(
+        get_or_create_session, session_id, user["user_email"]
+    )
+
+    # Constructing the agent hits the DB for requester context.
+    agent = await run_in_threadpool(
+        HRAgentLangGraph, user["user_email"], resolved_session_id
+    )
+
+    async def event_stream():
+        chunks: list[str] = []
+        async for chunk in agent.achat_stream(message):
+            chunks.append(chunk)
+            yield f"data: {_dumps_sse({'delta': chunk})}\n\n"
+
+        await run_in_threadpool(
+            _session_repo.append_turn, resolved_session_id, message, "".join(chunks)
+        )
+        yield f"data: {_dumps_sse({'done': True, 'session_id': resolved_session_id})}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+# The session handlers below are plain ``def`` on purpose: FastAPI runs
+# them in its threadpool, so their synchronous repository calls don't
+# block the event loop.
 @app.post("/sessions", response_model=SessionInfo, tags=["Sessions"])
-async def create_new_session(user: dict = Depends(get_current_user)):
+def create_new_session(user: dict = Depends(get_current_user)):
     """Create a new conversation session."""
     session_id, session = get_or_create_session(None, user["user_email"])
 
-    return SessionInfo(
+    return SessionInfo.model_construct(
         session_id=session_id,
         user_email=user["user_email"],
-        created_at=session["created_at"].isoformat(),
+        created_at=session["created_at"],
         turn_count=0,
         has_pending_confirmation=False,
         title=None,
@@ -690,22 +769,22 @@ async def create_new_session(user: dict = Depends(get_current_user)):
 
 
 @app.get("/sessions/{session_id}", response_model=SessionInfo, tags=["Sessions"])
-async def get_session_info(session_id: str, user: dict = Depends(get_current_user)):
+def get_session_info(session_id: str, user: dict = Depends(get_current_user)):
     """Get information about a conversation session."""
-    if session_id not in _sessions:
+    session = _session_repo.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    session = _sessions[session_id]
     if session["user_email"] != user["user_email"]:
         raise HTTPException(status_code=403, detail="Access denied to this session")
 
-    return SessionInfo(
+    return SessionInfo.model_construct(
         session_id=session_id,
         user_email=session["user_email"],
-        created_at=session["created_at"].isoformat(),
-        turn_count=len(session["turns"]),
+        created_at=session["created_at"],
+        turn_count=session["turn_count"],
         has_pending_confirmation=session["pending_confirmation"] is not None,
-        title=build_session_title(session),
+        title=build_session_title(session["first_query"]),
     )
 
 
@@ -714,57 +793,59 @@ async def get_session_info(session_id: str, user: dict = Depends(get_current_use
     response_model=list[SessionTurnRecord],
     tags=["Sessions"],
 )
-async def get_session_turns(session_id: str, user: dict = Depends(get_current_user)):
+def get_session_turns(session_id: str, user: dict = Depends(get_current_user)):
     """Get turn history for a conversation session."""
-    if session_id not in _sessions:
+    session = _session_repo.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    session = _sessions[session_id]
     if session["user_email"] != user["user_email"]:
         raise HTTPException(status_code=403, detail="Access denied to this session")
 
-    turns: list[SessionTurnRecord] = []
-    for turn in session.get("turns", []):
-        turns.append(
-            SessionTurnRecord(
-                query=str(turn.get("query", "")),
-                response=str(turn.get("response", "")),
-                timestamp=str(turn.get("timestamp", datetime.now().isoformat())),
-            )
+    return [
+        SessionTurnRecord.model_construct(
+            query=turn["query"],
+            response=turn["response"],
+            timestamp=turn["created_at"],
         )
-    return turns
+        for turn in _session_repo.list_turns(session_id)
+    ]
 
 
 @app.delete("/sessions/{session_id}", tags=["Sessions"])
-async def delete_session(session_id: str, user: dict = Depends(get_current_user)):
+def delete_session(session_id: str, user: dict = Depends(get_current_user)):
     """Delete a conversation session."""
-    if session_id not in _sessions:
+    session = _session_repo.get(session_id)
+    if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    session = _sessions[session_id]
     if session["user_email"] != user["user_email"]:
         raise HTTPException(status_code=403, detail="Access denied to this session")
 
-    del _sessions[session_id]
+    _session_repo.delete(session_id)
     return {"message": "Session deleted successfully"}
 
 
 @app.get("/sessions", response_model=list[SessionInfo], tags=["Sessions"])
-async def list_my_sessions(user: dict = Depends(get_current_user)):
+def list_my_sessions(user: dict = Depends(get_current_user)):
     """List all sessions for the current user."""
-    user_sessions = [
-        SessionInfo(
-            session_id=sid,
+    items = [
+        SessionInfo.model_construct(
+            session_id=s["session_id"],
             user_email=s["user_email"],
-            created_at=s["created_at"].isoformat(),
-            turn_count=len(s["turns"]),
+            created_at=s["created_at"],
+            turn_count=s["turn_count"],
             has_pending_confirmation=s["pending_confirmation"] is not None,
-            title=build_session_title(s),
+            title=build_session_title(s["first_query"]),
         )
-        for sid, s in _sessions.items()
-        if s["user_email"] == user["user_email"]
+        for s in _session_repo.list_for_user(user["user_email"])
     ]
-    return user_sessions
+    # Serialize straight to JSON bytes with the precompiled adapter,
+    # skipping FastAPI's per-item response_model re-validation.
+    return Response(
+        content=_session_list_adapter.dump_json(items),
+        media_type="application/json",
+    )
 
 
 @app.get("/escalations", response_model=list[EscalationRecord], tags=["Escalations"])
@@ -1246,11 +1327,15 @@ async def get_metrics():
     return metrics.get_stats()
 
 
+def _check_database() -> None:
+    """Round-trip the shared pooled engine."""
+    with get_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
 @app.get("/health/detailed", tags=["System"])
 async def detailed_health_check():
     """Detailed health check with dependency status."""
-    from hr_agent.utils.db import get_engine
-
     health = {
         "status": "healthy",
         "timestamp": datetime.now().isoformat(),
@@ -1260,9 +1345,7 @@ async def detailed_health_check():
 
     # Check database
     try:
-        engine = get_engine()
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        await run_in_threadpool(_check_database)
         health["checks"]["database"] = {"status": "healthy"}
     except (SQLAlchemyError, OSError) as e:
         health["checks"]["database"] = {"status": "unhealthy", "error": str(e)}
@@ -1294,12 +1377,36 @@ async def detailed_health_check():
 
 def main():
     """Run the API server."""
-    uvicorn.run(
-        "hr_agent.api:app",
-        host=settings.api_host if hasattr(settings, "api_host") else "0.0.0.0",
-        port=settings.api_port if hasattr(settings, "api_port") else 8000,
-        reload=True,
-    )
+    # uvicorn is only needed by this entrypoint, not by anything that
+    # imports the app (tests, ASGI servers pointing at apps.api:app).
+    import uvicorn
+
+    host = settings.api_host if hasattr(settings, "api_host") else "0.0.0.0"
+    port = settings.api_port if hasattr(settings, "api_port") else 8000
+
+    if settings.env == "prod":
+        import os
+
+        # Seed once in the parent before workers fork; lifespan skips it.
+        seed_if_needed()
+        uvicorn.run(
+            "apps.api.server:app",
+            host=host,
+            port=port,
+            reload=False,
+            workers=2 * (os.cpu_count() or 1) + 1,
+            # "auto" picks uvloop/httptools when installed and falls back
+            # to the stdlib implementations otherwise.
+            loop="auto",
+            http="auto",
+        )
+    else:
+        uvicorn.run(
+            "apps.api.server:app",
+            host=host,
+            port=port,
+            reload=True,
+        )
 
 
 if __name__ == "__main__":
@@ -18,75 +18,61 @@ Architecture:
 - policies/: YAML policy configurations
 """
 
-# LangGraph Agent
-from .agent.langgraph_agent import HRAgentLangGraph, run_hr_agent
-
-# Services
-from .services import (
-    get_employee_service,
-    get_holiday_service,
-    get_compensation_service,
-    get_company_service,
-    get_escalation_service,
-    EmployeeService,
-    HolidayService,
-    CompensationService,
-    CompanyService,
-    EscalationService,
-)
-from .tools.langchain_tools import get_all_tools
-
-# Domain Models
-from .domain.models import (
-    UserRole,
-    HolidayRequestStatus,
-    EscalationStatus,
-    AgentAction,
-    ChatRequest,
-    ChatResponse,
-    UserContext,
-)
-
-# Infrastructure
-from .utils.registry import registry, AppRegistry
-from .utils.errors import (
-    HRAgentError,
-    AuthorizationError,
-    ValidationError,
-    ResourceNotFoundError,
-)
-
-__all__ = [
+# Public names resolve lazily (PEP 562): importing the package no longer
+# drags in LangChain/LangGraph, so entrypoints that never touch the agent
+# (CLI usage errors, seed scripts) skip seconds of cold-start imports.
+_LAZY_EXPORTS = {
     # Agent
-    "HRAgentLangGraph",
-    "run_hr_agent",
+    "HRAgentLangGraph": ".agent.langgraph_agent",
+    "run_hr_agent": ".agent.langgraph_agent",
     # Services
-    "get_employee_service",
-    "get_holiday_service",
-    "get_compensation_service",
-    "get_company_service",
-    "get_escalation_service",
-    "EmployeeService",
-    "HolidayService",
-    "CompensationService",
-    "CompanyService",
-    "EscalationService",
+    "get_employee_service": ".services",
+    "get_holiday_service": ".services",
+    "get_compensation_service": ".services",
+    "get_company_service": ".services",
+    "get_escalation_service": ".services",
+    "EmployeeService": ".services",
+    "HolidayService": ".services",
+    "CompensationService": ".services",
+    "CompanyService": ".services",
+    "EscalationService": ".services",
     # Tools
-    "get_all_tools",
+    "get_all_tools": ".tools.langchain_tools",
     # Registry
-    "registry",
-    "AppRegistry",
+    "registry": ".utils.registry",
+    "AppRegistry": ".utils.registry",
     # Models
-    "UserRole",
-    "HolidayRequestStatus",
-    "EscalationStatus",
-    "AgentAction",
-    "ChatRequest",
-    "ChatResponse",
-    "UserContext",
+    "UserRole": ".domain.models",
+    "HolidayRequestStatus": ".domain.models",
+    "EscalationStatus": ".domain.models",
+    "AgentAction": ".domain.models",
+    "ChatRequest": ".domain.models",
+    "ChatResponse": ".domain.models",
+    "UserContext": ".domain.models",
     # Errors
-    "HRAgentError",
-    "AuthorizationError",
-    "ValidationError",
-    "ResourceNotFoundError",
-]
+    "HRAgentError": ".utils.errors",
+    "AuthorizationError": ".utils.errors",
+    "ValidationError": ".utils.errors",
+    "ResourceNotFoundError": ".utils.errors",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_path = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+
+    value = getattr(import_module(module_path, __name__), name)
+    # Cache so subsequent lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -8,30 +8,38 @@ Contains the LangGraph-based agent with:
 - LangSmith tracing integration
 """
 
-# LangGraph Agent
-from .langgraph_agent import HRAgentLangGraph, run_hr_agent
-
-# Policy Engine
-from ..policies.policy_engine import (
-    PolicyEngine,
-    PolicyContext,
-    PolicyRule,
-    PolicyResult,
-    get_policy_engine,
-    requires_confirmation,
-    get_confirmation_message,
-)
-
-__all__ = [
+# Lazily resolved (PEP 562) so importing the subpackage doesn't pull in
+# LangGraph or the policy engine until a symbol is actually used.
+_LAZY_EXPORTS = {
     # Agent (LangGraph)
-    "HRAgentLangGraph",
-    "run_hr_agent",
+    "HRAgentLangGraph": ".langgraph_agent",
+    "run_hr_agent": ".langgraph_agent",
     # Policy Engine
-    "PolicyEngine",
-    "PolicyContext",
-    "PolicyRule",
-    "PolicyResult",
-    "get_policy_engine",
-    "requires_confirmation",
-    "get_confirmation_message",
-]
+    "PolicyEngine": "..policies.policy_engine",
+    "PolicyContext": "..policies.policy_engine",
+    "PolicyRule": "..policies.policy_engine",
+    "PolicyResult": "..policies.policy_engine",
+    "get_policy_engine": "..policies.policy_engine",
+    "requires_confirmation": "..policies.policy_engine",
+    "get_confirmation_message": "..policies.policy_engine",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    try:
+        module_path = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    from importlib import import_module
+
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
@@ -9,9 +9,14 @@ A LangGraph-based agent for HR operations with:
 """
 
 from typing import TypedDict, Annotated, Literal, Any, Sequence
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import json
 import operator
+import threading
+import time
 
 from langchain_core.messages import (
     BaseMessage,
@@ -25,9 +30,26 @@ from langgraph.graph import StateGraph, END
 
 from ..tools.langchain_tools import (
     get_all_tools,
+    get_read_only_tools,
     TOOL_MAP,
 )
+from ..repositories import get_employee_repo
 from ..services.base import get_employee_service
+
+# Tool results (often wide org charts or calendars) are serialized for the
+# LLM on every turn; orjson does this several times faster than stdlib json
+# and handles dataclasses natively.
+try:
+    import orjson
+
+    def _dumps_tool_result(value) -> str:
+        return orjson.dumps(value, default=str).decode()
+
+except ImportError:  # pragma: no cover - depends on environment
+
+    def _dumps_tool_result(value) -> str:
+        return json.dumps(value, default=str)
+
 from ..configs.config import settings, get_langfuse_handler
 from ..tracing.observability import logger
 from ..policies.policy_engine import get_policy_engine, PolicyContext
@@ -78,7 +100,7 @@ User Employee ID: {user_id}
 **Available Tool Categories:**
 - Employee Info: search_employee, get_employee_basic, get_employee_tenure
 - Organization: get_manager, get_direct_reports, get_manager_chain, get_team_overview, get_department_directory, get_org_chart
-- Time Off: get_holiday_balance, get_holiday_requests, submit_holiday_request, cancel_holiday_request, get_pending_approvals, approve_holiday_request, reject_holiday_request, get_team_calendar
+- Time Off: get_holiday_balance, get_holiday_requests, submit_holiday_request, cancel_holiday_request, get_pending_approvals, approve_holiday_request, reject_holiday_request, batch_holiday_action (several requests in one call), get_team_calendar
 - Compensation: get_compensation, get_salary_history, get_team_compensation_summary (restricted)
 - Company Info: get_company_policies, get_policy_details, get_company_holidays, get_announcements, get_upcoming_events
 
@@ -95,19 +117,36 @@ User Employee ID: {user_id}
 """
 
 
-def get_system_message(state: AgentState) -> SystemMessage:
-    """Generate system message with user context."""
-    # Get user info
-    user_info = get_employee_service().get_basic_info(state["user_id"])
+@lru_cache(maxsize=1024)
+def _system_prompt_for(
+    current_date: str, user_id: int, user_email: str, user_role: str
+) -> str:
+    """Format the system prompt for one (date, user) pair.
+
+    The template is multi-kilobyte and every input only changes per user
+    or per day, yet agent_node re-rendered it (plus an employee lookup
+    for the display name) before every single LLM call. Caching the
+    rendered string makes the per-turn cost a tuple hash.
+    """
+    user_info = get_employee_service().get_basic_info(user_id)
     user_name = user_info.get("preferred_name", "User") if user_info else "User"
+    return SYSTEM_PROMPT.format(
+        current_date=current_date,
+        user_name=user_name,
+        user_email=user_email,
+        user_role=user_role,
+        user_id=user_id,
+    )
 
+
+def get_system_message(state: AgentState) -> SystemMessage:
+    """Generate system message with user context."""
     return SystemMessage(
-        content=SYSTEM_PROMPT.format(
-            current_date=state["current_date"],
-            user_name=user_name,
-            user_email=state["user_email"],
-            user_role=state["user_role"],
-            user_id=state["user_id"],
+        content=_system_prompt_for(
+            state["current_date"],
+            state["user_id"],
+            state["user_email"],
+            state["user_role"],
         )
     )
 
@@ -143,6 +182,30 @@ def get_llm():
     return _cached_llm
 
 
+_cached_summary_llm = None
+
+
+def get_summary_llm():
+    """Get a plain LLM (no tools bound) for history summarization (cached)."""
+    global _cached_summary_llm
+    if _cached_summary_llm is not None:
+        return _cached_summary_llm
+
+    if settings.llm_base_url:
+        _cached_summary_llm = ChatOpenAI(
+            model=settings.llm_model,
+            api_key=settings.llm_api_key,
+            base_url=settings.llm_base_url,
+            temperature=0,
+        )
+    else:
+        _cached_summary_llm = ChatOpenAI(
+            model=settings.llm_model,
+            temperature=0,
+        )
+    return _cached_summary_llm
+
+
 # ============================================================================
 # NODE FUNCTIONS
 # ============================================================================
@@ -161,6 +224,15 @@ def agent_node(state: AgentState) -> dict:
     return {"messages": [response]}
 
 
+# The denial payload never varies, so serialize it once at import.
+_ACCESS_DENIED_CONTENT = json.dumps(
+    {
+        "error": "Access Denied",
+        "message": "You don't have permission to access this information. You can only view your own data or data for your direct reports.",
+    }
+)
+
+
 def check_authorization(state: AgentState) -> dict:
     """Check if the requested tool call is authorized."""
     messages = state["messages"]
@@ -191,12 +263,7 @@ def check_authorization(state: AgentState) -> dict:
         if not policy_engine.is_allowed(ctx):
             # Create a denial message
             denial_msg = ToolMessage(
-                content=json.dumps(
-                    {
-                        "error": "Access Denied",
-                        "message": "You don't have permission to access this information. You can only view your own data or data for your direct reports.",
-                    }
-                ),
+                content=_ACCESS_DENIED_CONTENT,
                 tool_call_id=tool_call["id"],
             )
             return {"messages": [denial_msg]}
@@ -204,6 +271,90 @@ def check_authorization(state: AgentState) -> dict:
     return {}
 
 
+# Tools whose employee_id argument resolves through the cached employee
+# point read; a parallel batch of these is prefetched with one IN query.
+_EMPLOYEE_POINT_TOOLS = {"get_employee_basic", "get_employee_tenure"}
+
+
+def _prefetch_employees(tool_calls: list[dict]) -> None:
+    """Collapse sibling employee point reads into a single query."""
+    ids = {
+        tc["args"].get("employee_id")
+        for tc in tool_calls
+        if tc["name"] in _EMPLOYEE_POINT_TOOLS
+    }
+    ids.discard(None)
+    if len(ids) > 1:
+        get_employee_repo().warm_employees(list(ids))
+
+
+# Tools are I/O-bound (SQLAlchemy round-trips), so sibling tool calls
+# from one LLM turn run concurrently: total latency collapses from the
+# sum of the calls to the slowest one.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="hr-tool")
+
+
+def _run_tool(tool_name: str, tool_args: dict) -> Any:
+    """Execute one tool call, mapping any failure to an error payload."""
+    tool_func = TOOL_MAP.get(tool_name)
+    if tool_func is None:
+        return {"error": f"Unknown tool: {tool_name}"}
+    try:
+        return tool_func.invoke(tool_args)
+    except Exception as e:
+        return {"error": str(e)}
+
+
+# Read-only tool results repeat heavily across turns and sessions (the
+# LLM re-fetches the same employee or policy it just saw), so they are
+# cached briefly, already serialized. Error results are never cached,
+# and any mutating tool flushes the cache so a read after a write can't
+# see the pre-write result. Keys are (name, sorted args): authorization
+# runs per call in check_authorization before the cache is consulted.
+_READ_ONLY_TOOL_NAMES = frozenset(t.name for t in get_read_only_tools())
+_TOOL_CACHE_TTL_NS = 60 * 1_000_000_000
+_TOOL_CACHE_MAX = 2048
+_tool_cache: OrderedDict[tuple, tuple[int, str]] = OrderedDict()
+_tool_cache_lock = threading.Lock()
+
+
+def _tool_message_content(tool_name: str, tool_args: dict) -> str:
+    """Run one tool call and return its serialized ToolMessage content."""
+    cacheable = tool_name in _READ_ONLY_TOOL_NAMES
+    if cacheable:
+        try:
+            key = (tool_name, tuple(sorted(tool_args.items())))
+            # Force the hash here: building the tuple succeeds even when
+            # an arg value is a list, and the TypeError would otherwise
+            # surface from the cache lookup below.
+            hash(key)
+        except TypeError:
+            cacheable = False
+
+    if cacheable:
+        with _tool_cache_lock:
+            entry = _tool_cache.get(key)
+            if entry is not None and entry[0] > time.monotonic_ns():
+                _tool_cache.move_to_end(key)
+                return entry[1]
+
+    result = _run_tool(tool_name, tool_args)
+    content = _dumps_tool_result(result)
+
+    if not cacheable:
+        if tool_name in TOOL_MAP:
+            with _tool_cache_lock:
+                _tool_cache.clear()
+    elif not (isinstance(result, dict) and "error" in result):
+        with _tool_cache_lock:
+            _tool_cache[key] = (time.monotonic_ns() + _TOOL_CACHE_TTL_NS, content)
+            _tool_cache.move_to_end(key)
+            if len(_tool_cache) > _TOOL_CACHE_MAX:
+                _tool_cache.popitem(last=False)
+
+    return content
+
+
 def tool_node(state: AgentState) -> dict:
     """Execute tool calls."""
     messages = state["messages"]
@@ -212,36 +363,29 @@ def tool_node(state: AgentState) -> dict:
     if not hasattr(last_message, "tool_calls") or not last_message.tool_calls:
         return {}
 
-    tool_messages = []
-    tools_called = list(state.get("tools_called", []))
+    tool_calls = last_message.tool_calls
+    _prefetch_employees(tool_calls)
 
-    for tool_call in last_message.tool_calls:
-        tool_name = tool_call["name"]
-        tool_args = tool_call["args"]
+    tools_called = list(state.get("tools_called", []))
+    for tool_call in tool_calls:
+        if tool_call["name"] not in tools_called:
+            tools_called.append(tool_call["name"])
 
-        # Track tool call
-        if tool_name not in tools_called:
-            tools_called.append(tool_name)
-
-        # Get the tool function
-        tool_func = TOOL_MAP.get(tool_name)
-
-        if tool_func is None:
-            result = {"error": f"Unknown tool: {tool_name}"}
-        else:
-            try:
-                # Invoke the tool
-                result = tool_func.invoke(tool_args)
-            except Exception as e:
-                result = {"error": str(e)}
-
-        # Create tool message
-        tool_messages.append(
-            ToolMessage(
-                content=json.dumps(result, default=str),
-                tool_call_id=tool_call["id"],
-            )
-        )
+    if len(tool_calls) == 1:
+        # Skip the pool handoff for the common single-call turn.
+        contents = [_tool_message_content(tool_calls[0]["name"], tool_calls[0]["args"])]
+    else:
+        futures = [
+            _TOOL_POOL.submit(_tool_message_content, tc["name"], tc["args"])
+            for tc in tool_calls
+        ]
+        contents = [future.result() for future in futures]
+
+    # Assemble in submission order so tool_call_id pairing is preserved.
+    tool_messages = [
+        ToolMessage(content=content, tool_call_id=tool_call["id"])
+        for tool_call, content in zip(tool_calls, contents)
+    ]
 
     return {
         "messages": tool_messages,
@@ -287,14 +431,12 @@ def check_auth_result(state: AgentState) -> Literal["execute", "agent"]:
 
     last_message = messages[-1]
 
-    # If the last message is a ToolMessage with an error, go back to agent
+    # If the last message is the denial ToolMessage, go back to agent.
+    # Denials are always the exact constant payload, so an equality check
+    # replaces parsing every (potentially large) tool result as JSON.
     if isinstance(last_message, ToolMessage):
-        try:
-            content = json.loads(last_message.content)
-            if content.get("error") == "Access Denied":
-                return "agent"
-        except (json.JSONDecodeError, TypeError):
-            pass
+        if last_message.content == _ACCESS_DENIED_CONTENT:
+            return "agent"
 
     return "execute"
 
@@ -363,6 +505,24 @@ def compile_hr_agent(checkpointer=None):
 # HR AGENT CLASS (Wrapper for compatibility)
 # ============================================================================
 
+# Beyond this many history messages, the oldest half is folded into a
+# single summary note so long conversations pay a bounded prompt-token
+# cost per turn instead of replaying every raw turn.
+_COMPACT_THRESHOLD = 20
+
+_SUMMARY_PROMPT = """Condense the following HR-assistant conversation into a short memory note.
+Keep only what later turns may need: entities (people, employee IDs, dates,
+request IDs), user preferences, unresolved questions, and pending or confirmed
+actions. Merge in the previous note when one exists.
+
+Previous note:
+{previous_summary}
+
+Conversation:
+{transcript}
+
+Memory note:"""
+
 
 class HRAgentLangGraph:
     """
@@ -371,6 +531,19 @@ class HRAgentLangGraph:
     Drop-in replacement for the original HRAgent class.
     """
 
+    __slots__ = (
+        "user_email",
+        "session_id",
+        "_trace_metadata",
+        "requester_context",
+        "_user_id",
+        "_user_role",
+        "graph",
+        "_message_history",
+        "_history_summary",
+        "_tools_called",
+    )
+
     def __init__(
         self,
         user_email: str,
@@ -383,8 +556,11 @@ class HRAgentLangGraph:
         )
         self._trace_metadata = trace_metadata or {}
 
-        # Get user context
+        # Get user context; normalize the hot fields once — every turn
+        # builds graph state and trace metadata from them.
         self.requester_context = self._get_requester_context(user_email)
+        self._user_id = int(self.requester_context.get("employee_id", 0))
+        self._user_role = self.requester_context.get("role", "employee")
 
         # Compile the graph (no checkpointer -- we manage history ourselves)
         self.graph = compile_hr_agent()
@@ -392,6 +568,9 @@ class HRAgentLangGraph:
         # Conversation history for multi-turn support
         self._message_history: list[BaseMessage] = []
 
+        # Summary note covering turns dropped by compaction
+        self._history_summary: str | None = None
+
         # Track tools called (for eval compatibility)
         self._tools_called: list[str] = []
 
@@ -399,15 +578,65 @@ class HRAgentLangGraph:
         """Get the requester's context including role and permissions."""
         return get_employee_service().get_requester_context(user_email)
 
+    def _maybe_compact(self) -> None:
+        """Fold the oldest half of a long history into a summary note.
+
+        The raw turns stay bounded: once the history crosses the
+        threshold, the oldest half is summarized into
+        self._history_summary (merging any earlier note) and dropped
+        from the prompt. A failed summarization leaves the history
+        untouched rather than losing turns.
+        """
+        if len(self._message_history) < _COMPACT_THRESHOLD:
+            return
+
+        split = len(self._message_history) // 2
+        # Never split between a question and its answer.
+        if isinstance(self._message_history[split], AIMessage):
+            split += 1
+        old, recent = self._message_history[:split], self._message_history[split:]
+
+        transcript = "\n".join(
+            f"{'User' if isinstance(m, HumanMessage) else 'Assistant'}: {m.content}"
+            for m in old
+        )
+        try:
+            result = get_summary_llm().invoke(
+                _SUMMARY_PROMPT.format(
+                    previous_summary=self._history_summary or "(none)",
+                    transcript=transcript,
+                )
+            )
+        except Exception as e:
+            logger.warning("History compaction failed", error=str(e))
+            return
+
+        if result.content:
+            self._history_summary = result.content
+            self._message_history = recent
+
+    def _prompt_messages(self) -> list[BaseMessage]:
+        """Messages for the next turn: summary note plus recent raw turns."""
+        if self._history_summary:
+            return [
+                SystemMessage(
+                    content="Summary of the earlier conversation (older turns "
+                    f"were compacted):\n{self._history_summary}"
+                ),
+                *self._message_history,
+            ]
+        return list(self._message_history)
+
     def chat(self, query: str) -> str:
         """Process a user query and return the response."""
+        self._maybe_compact()
         self._message_history.append(HumanMessage(content=query))
 
         initial_state: AgentState = {
-            "messages": list(self._message_history),
+            "messages": self._prompt_messages(),
             "user_email": self.user_email,
-            "user_id": self.requester_context.get("employee_id", 0),
-            "user_role": self.requester_context.get("role", "employee"),
+            "user_id": self._user_id,
+            "user_role": self._user_role,
             "tools_called": [],
             "current_date": datetime.now().strftime("%Y-%m-%d"),
         }
@@ -416,8 +645,8 @@ class HRAgentLangGraph:
             "configurable": {"thread_id": self.session_id},
             "metadata": {
                 "user_email": self.user_email,
-                "user_id": self.requester_context.get("employee_id"),
-                "user_role": self.requester_context.get("role"),
+                "user_id": self._user_id,
+                "user_role": self._user_role,
                 "session_id": self.session_id,
             },
             "tags": ["hr-agent", "langgraph"],
@@ -429,8 +658,8 @@ class HRAgentLangGraph:
             langfuse_handler.session_id = self.session_id
             langfuse_handler.user_id = self.user_email
             metadata = {
-                "user_role": self.requester_context.get("role"),
-                "user_id": self.requester_context.get("employee_id"),
+                "user_role": self._user_role,
+                "user_id": self._user_id,
             }
             if self._trace_metadata:
                 metadata.update(self._trace_metadata)
@@ -466,13 +695,14 @@ class HRAgentLangGraph:
 
         Yields chunks of the response as they become available.
         """
+        self._maybe_compact()
         self._message_history.append(HumanMessage(content=user_input))
 
         initial_state: AgentState = {
-            "messages": list(self._message_history),
+            "messages": self._prompt_messages(),
             "user_email": self.user_email,
-            "user_id": self.requester_context.get("employee_id", 0),
-            "user_role": self.requester_context.get("role", "employee"),
+            "user_id": self._user_id,
+            "user_role": self._user_role,
             "tools_called": [],
             "current_date": datetime.now().strftime("%Y-%m-%d"),
         }
@@ -481,8 +711,8 @@ class HRAgentLangGraph:
             "configurable": {"thread_id": self.session_id},
             "metadata": {
                 "user_email": self.user_email,
-                "user_id": self.requester_context.get("employee_id"),
-                "user_role": self.requester_context.get("role"),
+                "user_id": self._user_id,
+                "user_role": self._user_role,
                 "session_id": self.session_id,
             },
             "tags": ["hr-agent", "langgraph"],
@@ -494,8 +724,8 @@ class HRAgentLangGraph:
             langfuse_handler.session_id = self.session_id
             langfuse_handler.user_id = self.user_email
             metadata = {
-                "user_role": self.requester_context.get("role"),
-                "user_id": self.requester_context.get("employee_id"),
+                "user_role": self._user_role,
+                "user_id": self._user_id,
             }
             if self._trace_metadata:
                 metadata.update(self._trace_metadata)
@@ -520,6 +750,67 @@ class HRAgentLangGraph:
             logger.error("Agent stream error", error=str(e))
             yield f"An error occurred: {str(e)}"
 
+    async def achat_stream(self, user_input: str):
+        """Async variant of chat_stream for streaming HTTP endpoints.
+
+        Yields response chunks without blocking the event loop; sync graph
+        nodes run in LangGraph's executor.
+        """
+        self._maybe_compact()
+        self._message_history.append(HumanMessage(content=user_input))
+
+        initial_state: AgentState = {
+            "messages": self._prompt_messages(),
+            "user_email": self.user_email,
+            "user_id": self._user_id,
+            "user_role": self._user_role,
+            "tools_called": [],
+            "current_date": datetime.now().strftime("%Y-%m-%d"),
+        }
+
+        config = {
+            "configurable": {"thread_id": self.session_id},
+            "metadata": {
+                "user_email": self.user_email,
+                "user_id": self._user_id,
+                "user_role": self._user_role,
+                "session_id": self.session_id,
+            },
+            "tags": ["hr-agent", "langgraph"],
+        }
+
+        callbacks = []
+        langfuse_handler = get_langfuse_handler()
+        if langfuse_handler:
+            langfuse_handler.session_id = self.session_id
+            langfuse_handler.user_id = self.user_email
+            metadata = {
+                "user_role": self._user_role,
+                "user_id": self._user_id,
+            }
+            if self._trace_metadata:
+                metadata.update(self._trace_metadata)
+            langfuse_handler.metadata = metadata
+            callbacks.append(langfuse_handler)
+
+        if callbacks:
+            config["callbacks"] = callbacks
+
+        try:
+            # Stream events from the graph
+            async for event in self.graph.astream(
+                initial_state, config, stream_mode="messages"
+            ):
+                if isinstance(event, tuple) and len(event) == 2:
+                    msg, metadata = event
+                    if isinstance(msg, AIMessage) and msg.content:
+                        # Yield content chunks
+                        if isinstance(msg.content, str):
+                            yield msg.content
+        except Exception as e:
+            logger.error("Agent stream error", error=str(e))
+            yield f"An error occurred: {str(e)}"
+
     @property
     def tools_called(self) -> list[str]:
         """Get the list of tools called in the last interaction."""
@@ -527,6 +818,8 @@ class HRAgentLangGraph:
 
     # Compatibility property for evals
     class _SessionCompat:
+        __slots__ = ("_agent", "turns")
+
         def __init__(self, agent: "HRAgentLangGraph"):
             self._agent = agent
             self.turns = []
@@ -5,14 +5,15 @@ Supports both single-query mode and interactive multi-turn conversations.
 Built with LangGraph for agent orchestration.
 """
 
-from dotenv import load_dotenv
 from rich.console import Console
 from rich.panel import Panel
+import os
 import sys
+import time
 
-from ..seed import seed_if_needed
-from .configs.config import settings
-from .agent.langgraph_agent import HRAgentLangGraph, run_hr_agent
+# dotenv, settings, and the LangGraph agent are imported inside main()
+# after argv parsing: usage errors and -h shouldn't pay seconds of
+# LangChain cold start.
 
 console = Console()
 
@@ -29,6 +30,8 @@ def run_interactive(user_email: str):
         )
     )
 
+    from .agent.langgraph_agent import HRAgentLangGraph
+
     agent = HRAgentLangGraph(user_email)
 
     while True:
@@ -38,18 +41,21 @@ def run_interactive(user_email: str):
             if not question:
                 continue
 
-            if question.lower() in ("exit", "quit"):
+            # Normalize once; the command checks below share it.
+            command = question if question.islower() else question.lower()
+
+            if command in ("exit", "quit"):
                 console.print("[yellow]Goodbye![/yellow]")
                 break
 
-            if question.lower() == "clear":
+            if command == "clear":
                 agent = HRAgentLangGraph(user_email)  # New session
                 console.print("[yellow]Started new conversation.[/yellow]")
                 continue
 
-            if question.lower() == "confirm":
+            if command == "confirm":
                 question = "confirm_action"
-            elif question.lower() == "cancel":
+            elif command == "cancel":
                 question = "cancel_action"
 
             with console.status("[cyan]Thinking...[/cyan]"):
@@ -64,51 +70,116 @@ def run_interactive(user_email: str):
             console.print(f"[red]Error: {e}[/red]")
 
 
+def _ask_daemon(user_email: str, question: str) -> str | None:
+    """Route a single query through the background daemon.
+
+    Spawns the daemon on first use (connection refused) and retries until
+    it comes up. Returns None when the daemon can't be reached in time, in
+    which case the caller falls back to an in-process agent.
+    """
+    from . import daemon
+
+    payload = {"user_email": user_email, "question": question}
+
+    def ask() -> str:
+        response = daemon.request(payload)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["answer"]
+
+    try:
+        return ask()
+    except (ConnectionRefusedError, FileNotFoundError):
+        pass
+
+    import subprocess
+
+    subprocess.Popen(
+        [sys.executable, "-m", "hr_agent.daemon"],
+        start_new_session=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+    # The daemon pays the import cold start we're avoiding; give it a
+    # generous window before falling back.
+    deadline = time.monotonic() + 30.0
+    while time.monotonic() < deadline:
+        time.sleep(0.25)
+        try:
+            return ask()
+        except (ConnectionRefusedError, FileNotFoundError):
+            continue
+
+    return None
+
+
+def _print_usage():
+    console.print("[bold]Usage:[/bold]")
+    console.print('  python -m hr_agent.cli "your question"')
+    console.print("  python -m hr_agent.cli -i  (interactive mode)")
+    console.print('  python -m hr_agent.cli -u email@example.com "question"')
+    console.print(
+        "  python -m hr_agent.cli -u email@example.com -i  (interactive with custom user)"
+    )
+
+
 def main():
-    load_dotenv()
-    seed_if_needed()
+    # Parse argv before importing anything heavy: interactive, custom
+    # user, single query, or usage error. user_email None means "use the
+    # configured demo user", resolved only after settings load.
+    interactive = False
+    user_email: str | None = None
+    question: str | None = None
 
-    # Check for interactive mode
     if len(sys.argv) == 2 and sys.argv[1] in ("-i", "--interactive"):
-        run_interactive(settings.demo_user_email)
-        return
-
-    # Check for user override
-    if len(sys.argv) >= 3 and sys.argv[1] in ("-u", "--user"):
+        interactive = True
+    elif len(sys.argv) >= 3 and sys.argv[1] in ("-u", "--user"):
         user_email = sys.argv[2]
-        if len(sys.argv) == 3:
-            # Interactive mode with custom user
-            run_interactive(user_email)
-            return
-        elif len(sys.argv) == 4 and sys.argv[3] == "-i":
-            run_interactive(user_email)
-            return
+        if len(sys.argv) == 3 or (len(sys.argv) == 4 and sys.argv[3] == "-i"):
+            interactive = True
         elif len(sys.argv) >= 4:
             question = " ".join(sys.argv[3:])
         else:
-            console.print("[bold]Usage:[/bold]")
-            console.print('  python -m hr_agent.cli "your question"')
-            console.print("  python -m hr_agent.cli -i  (interactive mode)")
-            console.print('  python -m hr_agent.cli -u email@example.com "question"')
-            console.print(
-                "  python -m hr_agent.cli -u email@example.com -i  (interactive with custom user)"
-            )
+            _print_usage()
             raise SystemExit(1)
     elif len(sys.argv) < 2:
-        console.print("[bold]Usage:[/bold]")
-        console.print('  python -m hr_agent.cli "your question"')
-        console.print("  python -m hr_agent.cli -i  (interactive mode)")
-        console.print('  python -m hr_agent.cli -u email@example.com "question"')
-        console.print(
-            "  python -m hr_agent.cli -u email@example.com -i  (interactive with custom user)"
-        )
+        _print_usage()
         raise SystemExit(1)
     else:
-        user_email = settings.demo_user_email
         question = sys.argv[1]
 
-    # Single query mode
-    answer = run_hr_agent(user_email, question)
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    if user_email is None:
+        from .configs.config import settings
+
+        user_email = settings.demo_user_email
+
+    if interactive:
+        from .seed import seed_if_needed
+
+        seed_if_needed()
+        run_interactive(user_email)
+        return
+
+    # Single query mode: prefer the persistent daemon so repeat queries
+    # skip the import cold start entirely; fall back to an in-process
+    # agent when the daemon is disabled or unreachable.
+    answer = None
+    if not os.environ.get("HR_AGENT_NO_DAEMON"):
+        answer = _ask_daemon(user_email, question)
+
+    if answer is None:
+        from .seed import seed_if_needed
+
+        seed_if_needed()
+
+        from .agent.langgraph_agent import run_hr_agent
+
+        answer = run_hr_agent(user_email, question)
 
     console.print(f"\n[bold cyan]User:[/bold cyan] {user_email}")
     console.print(f"[bold green]Q:[/bold green] {question}")
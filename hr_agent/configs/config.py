@@ -9,6 +9,8 @@ class Settings(BaseSettings):
         default="alex.kim@acme.com", validation_alias="DEMO_USER_EMAIL"
     )
     db_url: str = Field(default="sqlite:///./hr_demo.db", validation_alias="DB_URL")
+    db_pool_size: int = Field(default=5, validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, validation_alias="DB_MAX_OVERFLOW")
     allowed_test_user_emails: str = Field(
         default="", validation_alias="ALLOWED_TEST_USER_EMAILS"
     )
@@ -21,6 +23,7 @@ class Settings(BaseSettings):
     llm_model: str = Field(default="gpt-4o-mini", validation_alias="LLM_MODEL")
 
     # API Server settings
+    env: str = Field(default="dev", validation_alias="APP_ENV")
     api_host: str = Field(default="0.0.0.0", validation_alias="API_HOST")
     api_port: int = Field(default=8000, validation_alias="API_PORT")
 
@@ -0,0 +1,87 @@
+"""
+HR Agent CLI Daemon
+
+Persistent background process that loads LangGraph, the services, and the
+DB engine once, then answers CLI queries over a Unix domain socket. Repeat
+single-query invocations of the CLI skip the multi-second import cold
+start and pay only LLM latency.
+
+Protocol: one JSON request per connection ({"user_email", "question"}),
+one JSON response ({"answer"} or {"error"}), then the connection closes.
+
+Run with: python -m hr_agent.daemon
+"""
+
+import json
+import os
+import socket
+import tempfile
+
+
+def socket_path() -> str:
+    """Where the daemon listens; the CLI client must agree."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(runtime_dir, "hr-agent.sock")
+
+
+def _recv_all(conn: socket.socket) -> bytes:
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def request(payload: dict, timeout: float = 120.0) -> dict:
+    """Client side: send one request to a running daemon.
+
+    Raises ConnectionRefusedError / FileNotFoundError when no daemon is
+    listening, so the caller can decide to spawn one.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path())
+        sock.sendall(json.dumps(payload).encode())
+        sock.shutdown(socket.SHUT_WR)
+        return json.loads(_recv_all(sock))
+
+
+def serve():
+    """Import everything heavy once, then serve queries until killed."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    from .seed import seed_if_needed
+
+    seed_if_needed()
+
+    from .agent.langgraph_agent import run_hr_agent
+
+    path = socket_path()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        os.chmod(path, 0o600)  # Queries carry per-user HR data
+        server.listen()
+
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    payload = json.loads(_recv_all(conn))
+                    answer = run_hr_agent(payload["user_email"], payload["question"])
+                    response = {"answer": answer}
+                except Exception as e:  # Keep serving after a bad request
+                    response = {"error": str(e)}
+                try:
+                    conn.sendall(json.dumps(response).encode())
+                except OSError:
+                    pass  # Client gave up waiting
+
+
+if __name__ == "__main__":
+    serve()
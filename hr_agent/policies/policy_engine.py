@@ -8,6 +8,7 @@ Policies are defined declaratively and can be updated without code changes.
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from enum import Enum
 from typing import Callable, Any
 from ..utils.db import get_engine
@@ -74,6 +75,10 @@ CONDITION_EVALUATORS: dict[str, Callable[[PolicyContext, dict[str, Any]], bool]]
         ctx.requester_role in ("MANAGER", "HR")
         and helpers["is_direct_report"](ctx.requester_id, ctx.target_id)
     ),
+    "is_manager and is_self": lambda ctx, helpers: (
+        ctx.requester_role in ("MANAGER", "HR")
+        and ctx.requester_id == ctx.target_id
+    ),
 }
 
 
@@ -192,12 +197,14 @@ def _finance_has_cost_center_access(user_email: str, employee_id: int | None) ->
 
 # ========== CONFIRMATION REQUIREMENTS ==========
 
-ACTIONS_REQUIRING_CONFIRMATION = {
+# Read-only shared table; the proxy guards against accidental mutation.
+ACTIONS_REQUIRING_CONFIRMATION = MappingProxyType({
     "submit_holiday_request": "You're about to submit a holiday request for {days} days from {start_date} to {end_date}. Please confirm.",
     "cancel_holiday_request": "You're about to cancel holiday request #{request_id}. This action cannot be undone. Please confirm.",
     "approve_holiday_request": "You're about to approve holiday request #{request_id}. Please confirm.",
     "reject_holiday_request": "You're about to reject holiday request #{request_id}. Please confirm.",
-}
+    "batch_holiday_action": "You're about to apply a batch of approve/reject decisions to multiple holiday requests. Please confirm.",
+})
 
 
 def requires_confirmation(action: str) -> bool:
@@ -9,12 +9,14 @@ Benefits:
 """
 
 from .base import BaseRepository
+from .rows import EmployeeRow, HolidayRequestRow
 from .employee import EmployeeRepository
 from .holiday import HolidayRepository
 from .compensation import CompensationRepository
 from .company import CompanyRepository
 from .escalation import EscalationRepository
 from .hr_request import HRRequestRepository
+from .session import SessionRepository
 
 # Singleton instances
 _employee_repo: EmployeeRepository | None = None
@@ -23,6 +25,7 @@ _compensation_repo: CompensationRepository | None = None
 _company_repo: CompanyRepository | None = None
 _escalation_repo: EscalationRepository | None = None
 _hr_request_repo: HRRequestRepository | None = None
+_session_repo: SessionRepository | None = None
 
 
 def get_employee_repo() -> EmployeeRepository:
@@ -67,18 +70,29 @@ def get_hr_request_repo() -> HRRequestRepository:
     return _hr_request_repo
 
 
+def get_session_repo() -> SessionRepository:
+    global _session_repo
+    if _session_repo is None:
+        _session_repo = SessionRepository()
+    return _session_repo
+
+
 __all__ = [
     "BaseRepository",
+    "EmployeeRow",
+    "HolidayRequestRow",
     "EmployeeRepository",
     "HolidayRepository",
     "CompensationRepository",
     "CompanyRepository",
     "EscalationRepository",
     "HRRequestRepository",
+    "SessionRepository",
     "get_employee_repo",
     "get_holiday_repo",
     "get_compensation_repo",
     "get_company_repo",
     "get_escalation_repo",
     "get_hr_request_repo",
+    "get_session_repo",
 ]
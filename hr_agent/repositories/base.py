@@ -6,11 +6,23 @@ This allows easy swapping of implementations (SQL, API, Mock, etc.)
 """
 
 from abc import ABC
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 from sqlalchemy import text
 from ..utils.db import get_engine
 
 
+@lru_cache(maxsize=None)
+def _prepared(query: str):
+    """Build the TextClause for each distinct SQL statement once.
+
+    Repository SQL lives in string constants, so caching on the string
+    means SQLAlchemy lexes each statement a single time per process.
+    """
+    return text(query)
+
+
 class BaseRepository(ABC):
     """
     Abstract base repository defining common data access patterns.
@@ -27,32 +39,65 @@ class BaseRepository(ABC):
         """Execute a query and return results as list of dicts."""
         eng = self._get_engine()
         with eng.begin() as con:
-            rows = con.execute(text(query), params or {}).mappings().all()
+            rows = con.execute(_prepared(query), params or {}).mappings().all()
+            return [dict(r) for r in rows]
+
+    def _execute_query_as(
+        self, cls: type, query: str, params: dict | None = None
+    ) -> list:
+        """Execute a query and map each row onto a slotted row class."""
+        eng = self._get_engine()
+        with eng.begin() as con:
+            rows = con.execute(_prepared(query), params or {}).mappings().all()
+            return [cls(**r) for r in rows]
+
+    def _execute_query_streamed(
+        self, query: str, params: dict | None = None, limit: int | None = None
+    ) -> list[dict]:
+        """Execute a potentially wide query through a streaming cursor.
+
+        yield_per fetches rows in batches instead of materializing the
+        whole driver rowset (a true server-side cursor on PostgreSQL; a
+        batched fetch on SQLite), and `limit` stops consumption early so
+        at most that many rows cross into Python.
+        """
+        eng = self._get_engine()
+        with eng.begin() as con:
+            result = con.execute(
+                _prepared(query).execution_options(yield_per=500), params or {}
+            ).mappings()
+            rows = islice(result, limit) if limit is not None else result
             return [dict(r) for r in rows]
 
     def _execute_query_one(self, query: str, params: dict | None = None) -> dict | None:
         """Execute a query and return single result as dict or None."""
         eng = self._get_engine()
         with eng.begin() as con:
-            row = con.execute(text(query), params or {}).mappings().one_or_none()
+            row = con.execute(_prepared(query), params or {}).mappings().one_or_none()
             return dict(row) if row else None
 
     def _execute_scalar(self, query: str, params: dict | None = None) -> Any:
         """Execute a query and return scalar value."""
         eng = self._get_engine()
         with eng.begin() as con:
-            return con.execute(text(query), params or {}).scalar_one_or_none()
+            return con.execute(_prepared(query), params or {}).scalar_one_or_none()
 
     def _execute_insert(self, query: str, params: dict | None = None) -> int:
         """Execute an insert and return the last inserted ID."""
         eng = self._get_engine()
         with eng.begin() as con:
-            con.execute(text(query), params or {})
-            return con.execute(text("SELECT last_insert_rowid()")).scalar_one()
+            con.execute(_prepared(query), params or {})
+            return con.execute(_prepared("SELECT last_insert_rowid()")).scalar_one()
+
+    def _execute_insert_returning(self, query: str, params: dict | None = None) -> int:
+        """Execute an INSERT ... RETURNING and return the returned ID."""
+        eng = self._get_engine()
+        with eng.begin() as con:
+            return con.execute(_prepared(query), params or {}).scalar_one()
 
     def _execute_update(self, query: str, params: dict | None = None) -> int:
         """Execute an update and return rows affected."""
         eng = self._get_engine()
         with eng.begin() as con:
-            result = con.execute(text(query), params or {})
+            result = con.execute(_prepared(query), params or {})
             return result.rowcount
@@ -2,37 +2,108 @@
 Employee Repository - Employee and Organization data access
 """
 
-from datetime import datetime, date
+import json
+import re
+import threading
+import time
+from datetime import date
+from sqlalchemy import bindparam, text
 from .base import BaseRepository
+from .rows import EmployeeRow
+
+
+_SQL_EMPLOYEES_BY_IDS = text(
+    """SELECT employee_id, preferred_name, legal_name, email, title, department,
+              location, employment_status, hire_date, cost_center
+       FROM employee WHERE employee_id IN :ids"""
+).bindparams(bindparam("ids", expanding=True))
 
 
 class EmployeeRepository(BaseRepository):
     """Repository for employee and organization data."""
 
+    _EMPLOYEE_CACHE_MAX = 1024
+    _MANAGER_CACHE_MAX = 1024
+    _DROPDOWN_TTL_SECONDS = 60.0
+
+    def __init__(self):
+        # Point reads repeat heavily within one agent turn (several tools
+        # resolve the same employee), so memoize rows per repository.
+        self._employee_cache: dict[int, dict | None] = {}
+        # Manager rows are re-read constantly while walking chains (the CEO
+        # is visited from every employee), so memoize them per repository.
+        self._manager_cache: dict[int, dict | None] = {}
+        # (rows, expiry) for the UI dropdown, which re-reads the whole
+        # employee table on every page render otherwise.
+        self._dropdown_cache: tuple[list[dict], float] | None = None
+        # The repository is a singleton shared by the parallel tool pool,
+        # so cache reads/writes must not interleave across threads.
+        self._cache_lock = threading.Lock()
+
+    def clear_caches(self) -> None:
+        """Invalidate memoized lookups (call after employee updates)."""
+        with self._cache_lock:
+            self._employee_cache.clear()
+            self._manager_cache.clear()
+            self._dropdown_cache = None
+
+    def _cache_employee(self, employee_id: int, row: dict | None) -> None:
+        with self._cache_lock:
+            if len(self._employee_cache) >= self._EMPLOYEE_CACHE_MAX:
+                self._employee_cache.pop(next(iter(self._employee_cache)))
+            self._employee_cache[employee_id] = row
+
     # ========== SEARCH & BASIC INFO ==========
 
     def search(self, query: str, limit: int = 10) -> list[dict]:
         """Search employees by name, email, or title."""
-        q = f"%{query.lower()}%"
+        # Prefix-match every term against the FTS5 index instead of four
+        # un-indexable LIKE '%q%' scans over the employee table.
+        terms = re.findall(r"\w+", query)
+        if not terms:
+            return []
+        match = " ".join(f'"{term}"*' for term in terms)
         return self._execute_query(
-            """SELECT employee_id, preferred_name, legal_name, email, title, department
-               FROM employee
-               WHERE lower(preferred_name) LIKE :q
-                  OR lower(legal_name) LIKE :q
-                  OR lower(email) LIKE :q
-                  OR lower(title) LIKE :q
+            """SELECT e.employee_id, e.preferred_name, e.legal_name, e.email,
+                      e.title, e.department
+               FROM employee_fts f
+               JOIN employee e ON e.employee_id = f.rowid
+               WHERE employee_fts MATCH :q
+               ORDER BY rank
                LIMIT :lim""",
-            {"q": q, "lim": limit},
+            {"q": match, "lim": limit},
         )
 
     def get_by_id(self, employee_id: int) -> dict | None:
         """Get basic employee information."""
-        return self._execute_query_one(
+        with self._cache_lock:
+            if employee_id in self._employee_cache:
+                return self._employee_cache[employee_id]
+        row = self._execute_query_one(
             """SELECT employee_id, preferred_name, legal_name, email, title, department,
                       location, employment_status, hire_date, cost_center
                FROM employee WHERE employee_id=:e""",
             {"e": employee_id},
         )
+        self._cache_employee(employee_id, row)
+        return row
+
+    def warm_employees(self, employee_ids: list[int]) -> None:
+        """Prefetch several employees into the cache in one round trip.
+
+        Called before a batch of parallel tool calls so that the point
+        reads they issue are served from memory instead of N queries.
+        """
+        with self._cache_lock:
+            missing = [e for e in employee_ids if e not in self._employee_cache]
+        if not missing:
+            return
+        eng = self._get_engine()
+        with eng.begin() as con:
+            rows = con.execute(_SQL_EMPLOYEES_BY_IDS, {"ids": missing}).mappings().all()
+        found = {row["employee_id"]: dict(row) for row in rows}
+        for employee_id in missing:
+            self._cache_employee(employee_id, found.get(employee_id))
 
     def get_by_email(self, email: str) -> dict | None:
         """Get employee by email."""
@@ -50,19 +121,19 @@ class EmployeeRepository(BaseRepository):
 
     def get_tenure(self, employee_id: int) -> dict | None:
         """Get employee tenure information."""
-        row = self._execute_query_one(
-            """SELECT employee_id, preferred_name, hire_date, employment_status
-               FROM employee WHERE employee_id=:e""",
-            {"e": employee_id},
-        )
+        # Derived from the (cached) point read rather than its own query.
+        row = self.get_by_id(employee_id)
         if not row:
             return None
 
-        hire_date = datetime.strptime(row["hire_date"], "%Y-%m-%d").date()
+        hire_date = date.fromisoformat(row["hire_date"])
         years = (date.today() - hire_date).days / 365.25
 
         return {
-            **row,
+            "employee_id": row["employee_id"],
+            "preferred_name": row["preferred_name"],
+            "hire_date": row["hire_date"],
+            "employment_status": row["employment_status"],
             "years_of_service": round(years, 1),
         }
 
@@ -70,17 +141,28 @@ class EmployeeRepository(BaseRepository):
 
     def get_manager(self, employee_id: int) -> dict | None:
         """Get the direct manager of an employee."""
-        return self._execute_query_one(
+        with self._cache_lock:
+            if employee_id in self._manager_cache:
+                return self._manager_cache[employee_id]
+
+        mgr = self._execute_query_one(
             """SELECT m.employee_id, m.preferred_name, m.email, m.title, m.department
                FROM employee e
                JOIN employee m ON e.manager_employee_id = m.employee_id
                WHERE e.employee_id=:e""",
             {"e": employee_id},
         )
-
-    def get_direct_reports(self, manager_id: int) -> list[dict]:
+        with self._cache_lock:
+            if len(self._manager_cache) >= self._MANAGER_CACHE_MAX:
+                # Evict the oldest entry (insertion order) to stay bounded.
+                self._manager_cache.pop(next(iter(self._manager_cache)))
+            self._manager_cache[employee_id] = mgr
+        return mgr
+
+    def get_direct_reports(self, manager_id: int) -> list[EmployeeRow]:
         """Get all direct reports for a manager."""
-        return self._execute_query(
+        return self._execute_query_as(
+            EmployeeRow,
             """SELECT e.employee_id, e.preferred_name, e.email, e.title, e.department
                FROM manager_reports r
                JOIN employee e ON e.employee_id = r.report_employee_id
@@ -89,6 +171,17 @@ class EmployeeRepository(BaseRepository):
             {"m": manager_id},
         )
 
+    def count_direct_reports(self, manager_id: int) -> int:
+        """Count a manager's direct reports without materializing rows."""
+        return int(
+            self._execute_scalar(
+                """SELECT COUNT(*) FROM manager_reports
+                   WHERE manager_employee_id=:m""",
+                {"m": manager_id},
+            )
+            or 0
+        )
+
     def get_manager_chain(self, employee_id: int, max_depth: int = 6) -> list[dict]:
         """Get the full management chain up to CEO."""
         chain: list[dict] = []
@@ -111,37 +204,42 @@ class EmployeeRepository(BaseRepository):
         if not mgr:
             return {"error": "Manager not found"}
 
-        reports = self._execute_query(
-            """SELECT e.employee_id, e.preferred_name, e.title, e.department, e.employment_status
+        # Let the DB do the department bucketing via json_group_array.
+        grouped = self._execute_query(
+            """SELECT e.department,
+                      COUNT(*) AS dept_count,
+                      json_group_array(
+                        json_object('employee_id', e.employee_id,
+                                    'name', e.preferred_name,
+                                    'title', e.title,
+                                    'status', e.employment_status)
+                      ) AS members
                FROM manager_reports r
                JOIN employee e ON e.employee_id = r.report_employee_id
                WHERE r.manager_employee_id=:m
-               ORDER BY e.department, e.preferred_name""",
+               GROUP BY e.department
+               ORDER BY e.department""",
             {"m": manager_id},
         )
 
-        # Group by department
         by_dept: dict[str, list] = {}
-        for r in reports:
-            dept = r["department"]
-            by_dept.setdefault(dept, []).append(
-                {
-                    "employee_id": r["employee_id"],
-                    "name": r["preferred_name"],
-                    "title": r["title"],
-                    "status": r["employment_status"],
-                }
-            )
+        total = 0
+        for row in grouped:
+            members = json.loads(row["members"])
+            members.sort(key=lambda member: member["name"])
+            by_dept[row["department"]] = members
+            total += row["dept_count"]
 
         return {
             "manager": mgr,
-            "total_direct_reports": len(reports),
+            "total_direct_reports": total,
             "by_department": by_dept,
         }
 
     def get_department_members(self, department: str) -> list[dict]:
         """Get all employees in a department."""
-        return self._execute_query(
+        # Unbounded rowset; stream it rather than buffering in the driver.
+        return self._execute_query_streamed(
             """SELECT employee_id, preferred_name, email, title, location, employment_status
                FROM employee
                WHERE lower(department) = lower(:dept)
@@ -151,29 +249,6 @@ class EmployeeRepository(BaseRepository):
 
     def get_org_chart(self, root_id: int | None = None, max_depth: int = 3) -> dict:
         """Get organizational chart."""
-
-        def get_subtree(emp_id: int, depth: int) -> dict:
-            emp = self._execute_query_one(
-                """SELECT employee_id, preferred_name, title, department
-                   FROM employee WHERE employee_id=:e""",
-                {"e": emp_id},
-            )
-            if not emp:
-                return {}
-
-            result = dict(emp)
-            if depth < max_depth:
-                report_ids = self._execute_query(
-                    "SELECT report_employee_id FROM manager_reports WHERE manager_employee_id=:m",
-                    {"m": emp_id},
-                )
-                if report_ids:
-                    result["direct_reports"] = [
-                        get_subtree(r["report_employee_id"], depth + 1)
-                        for r in report_ids
-                    ]
-            return result
-
         # Find CEO if no root specified
         if root_id is None:
             root_id = self._execute_scalar(
@@ -183,23 +258,77 @@ class EmployeeRepository(BaseRepository):
         if not root_id:
             return {"error": "No root employee found"}
 
-        return get_subtree(root_id, 0)
+        # Fetch the whole subtree in one round trip instead of one query
+        # per node, then assemble the nested dict tree in Python. This is
+        # the wide "root" query, so it goes through the streaming cursor.
+        rows = self._execute_query_streamed(
+            """WITH RECURSIVE sub(employee_id, preferred_name, title, department,
+                                  parent_id, depth) AS (
+                 SELECT employee_id, preferred_name, title, department,
+                        CAST(NULL AS INTEGER), 0
+                 FROM employee WHERE employee_id=:root
+                 UNION ALL
+                 SELECT e.employee_id, e.preferred_name, e.title, e.department,
+                        mr.manager_employee_id, s.depth + 1
+                 FROM sub s
+                 JOIN manager_reports mr ON mr.manager_employee_id = s.employee_id
+                 JOIN employee e ON e.employee_id = mr.report_employee_id
+                 WHERE s.depth < :maxd
+               )
+               SELECT employee_id, preferred_name, title, department, parent_id
+               FROM sub ORDER BY depth""",
+            {"root": root_id, "maxd": max_depth},
+        )
+        if not rows:
+            return {}
+
+        # Rows arrive parent-before-child (ordered by depth), so a single
+        # pass can create each node and link it to its parent immediately.
+        nodes: dict[int, dict] = {}
+        for row in rows:
+            node = {
+                "employee_id": row["employee_id"],
+                "preferred_name": row["preferred_name"],
+                "title": row["title"],
+                "department": row["department"],
+                "direct_reports": [],
+            }
+            nodes[row["employee_id"]] = node
+            parent_id = row["parent_id"]
+            if parent_id is not None:
+                nodes[parent_id]["direct_reports"].append(node)
+
+        return nodes[root_id]
 
     # ========== IDENTITY & ROLE MAPPING ==========
 
     def get_employee_id_by_email(self, email: str) -> int | None:
-        """Get employee ID from email via identity map."""
+        """Get employee ID from email (denormalized onto employee)."""
         return self._execute_scalar(
-            "SELECT employee_id FROM identity_map WHERE user_email=:u", {"u": email}
+            "SELECT employee_id FROM employee WHERE user_email=:u", {"u": email}
         )
 
     def get_role_by_email(self, email: str) -> str:
-        """Get app role from email."""
+        """Get app role from email (denormalized onto employee)."""
         role = self._execute_scalar(
-            "SELECT app_role FROM app_role_map WHERE user_email=:u", {"u": email}
+            "SELECT app_role FROM employee WHERE user_email=:u", {"u": email}
         )
         return role or "EMPLOYEE"
 
+    def get_requester_bundle(self, email: str) -> dict | None:
+        """Get employee ID, role, name, and report IDs for an email in one query."""
+        return self._execute_query_one(
+            """SELECT e.employee_id,
+                      COALESCE(e.app_role, 'EMPLOYEE') AS role,
+                      e.preferred_name,
+                      (SELECT GROUP_CONCAT(report_employee_id)
+                       FROM manager_reports
+                       WHERE manager_employee_id = e.employee_id) AS reports
+               FROM employee e
+               WHERE e.user_email=:u""",
+            {"u": email},
+        )
+
     def get_direct_report_ids(self, manager_id: int) -> list[int]:
         """Get list of direct report employee IDs."""
         rows = self._execute_query(
@@ -220,12 +349,22 @@ class EmployeeRepository(BaseRepository):
     # ========== UI HELPERS ==========
 
     def list_all_for_dropdown(self) -> list[dict]:
-        """Get all employees for UI dropdown selection."""
-        return self._execute_query(
+        """Get all employees for UI dropdown selection (cached with TTL)."""
+        with self._cache_lock:
+            cached = self._dropdown_cache
+        if cached is not None:
+            rows, expiry = cached
+            if time.monotonic() < expiry:
+                return rows
+
+        rows = self._execute_query(
             """SELECT email, legal_name, preferred_name, title, department
                FROM employee
                ORDER BY legal_name""",
         )
+        with self._cache_lock:
+            self._dropdown_cache = (rows, time.monotonic() + self._DROPDOWN_TTL_SECONDS)
+        return rows
 
     def get_details_with_manager(self, email: str) -> dict | None:
         """Get employee details including manager name for UI display."""
@@ -2,9 +2,56 @@
 Holiday Repository - Time-off and leave management data access
 """
 
-from datetime import datetime
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from .base import BaseRepository
+from .rows import HolidayRequestRow
+
+
+# Statements executed outside the _execute_* helpers, compiled once at
+# import time rather than per call.
+
+_SQL_CREATE_REQUEST_GUARDED = text(
+    """WITH bal AS (
+         SELECT ent.entitlement_days + ent.carried_over_days
+                - COALESCE(SUM(CASE WHEN hr.status IN ('APPROVED','PENDING')
+                                    THEN hr.days END), 0) AS remaining
+         FROM holiday_entitlement ent
+         LEFT JOIN holiday_request hr
+           ON hr.employee_id = ent.employee_id AND hr.year=:y
+         WHERE ent.employee_id=:e AND ent.year=:y
+         GROUP BY ent.entitlement_days, ent.carried_over_days
+       )
+       INSERT INTO holiday_request
+         (employee_id, start_date, end_date, days, status, reason, requested_at)
+       SELECT :e, :start, :end, :days, 'PENDING', :reason,
+              strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+       WHERE COALESCE((SELECT remaining FROM bal), 0) >= :days
+         AND NOT EXISTS(
+           SELECT 1 FROM holiday_request
+           WHERE employee_id=:e AND status IN ('PENDING', 'APPROVED')
+             AND start_date <= :end AND end_date >= :start)
+       RETURNING request_id"""
+)
+
+_SQL_REVIEW_REQUEST = text(
+    """UPDATE holiday_request
+       SET status=:status, reviewed_by=:reviewer,
+           reviewed_at=strftime('%Y-%m-%dT%H:%M:%fZ', 'now'),
+           rejection_reason=:reason
+       WHERE request_id=:r"""
+)
+
+_SQL_SET_REQUEST_STATUS = text(
+    "UPDATE holiday_request SET status=:status WHERE request_id=:r"
+)
+
+_SQL_REQUESTS_FOR_APPROVAL = text(
+    """SELECT hr.request_id, hr.employee_id, hr.status, e.preferred_name
+       FROM holiday_request hr
+       JOIN employee e ON e.employee_id = hr.employee_id
+       JOIN manager_reports mr ON mr.report_employee_id = hr.employee_id
+       WHERE hr.request_id IN :rids AND mr.manager_employee_id = :m"""
+).bindparams(bindparam("rids", expanding=True))
 
 
 class HolidayRepository(BaseRepository):
@@ -14,14 +61,21 @@ class HolidayRepository(BaseRepository):
 
     def get_balance(self, employee_id: int, year: int) -> dict:
         """Get holiday balance for an employee."""
-        ent = self._execute_query_one(
-            """SELECT entitlement_days, carried_over_days
-               FROM holiday_entitlement
-               WHERE employee_id=:e AND year=:y""",
+        # Entitlement plus both status sums in a single round trip.
+        row = self._execute_query_one(
+            """SELECT ent.entitlement_days, ent.carried_over_days,
+                      COALESCE(SUM(CASE WHEN hr.status='APPROVED' THEN hr.days END), 0) AS approved,
+                      COALESCE(SUM(CASE WHEN hr.status='PENDING' THEN hr.days END), 0) AS pending
+               FROM holiday_entitlement ent
+               LEFT JOIN holiday_request hr
+                 ON hr.employee_id = ent.employee_id
+                AND hr.year=:y
+               WHERE ent.employee_id=:e AND ent.year=:y
+               GROUP BY ent.entitlement_days, ent.carried_over_days""",
             {"e": employee_id, "y": year},
         )
 
-        if not ent:
+        if not row:
             return {
                 "year": year,
                 "entitled": 0.0,
@@ -31,28 +85,10 @@ class HolidayRepository(BaseRepository):
                 "remaining": 0.0,
             }
 
-        approved = (
-            self._execute_scalar(
-                """SELECT COALESCE(SUM(days),0)
-               FROM holiday_request
-               WHERE employee_id=:e AND status='APPROVED' AND substr(start_date,1,4)=:yyyy""",
-                {"e": employee_id, "yyyy": str(year)},
-            )
-            or 0
-        )
-
-        pending = (
-            self._execute_scalar(
-                """SELECT COALESCE(SUM(days),0)
-               FROM holiday_request
-               WHERE employee_id=:e AND status='PENDING' AND substr(start_date,1,4)=:yyyy""",
-                {"e": employee_id, "yyyy": str(year)},
-            )
-            or 0
-        )
-
-        entitled = float(ent["entitlement_days"])
-        carried = float(ent["carried_over_days"])
+        approved = row["approved"] or 0
+        pending = row["pending"] or 0
+        entitled = float(row["entitlement_days"])
+        carried = float(row["carried_over_days"])
 
         return {
             "year": year,
@@ -71,9 +107,9 @@ class HolidayRepository(BaseRepository):
             """SELECT request_id, start_date, end_date, days, status, reason,
                       requested_at, reviewed_by, reviewed_at
                FROM holiday_request
-               WHERE employee_id=:e AND substr(start_date,1,4)=:yyyy
+               WHERE employee_id=:e AND year=:y
                ORDER BY start_date""",
-            {"e": employee_id, "yyyy": str(year)},
+            {"e": employee_id, "y": year},
         )
 
     def get_request_by_id(self, request_id: int) -> dict | None:
@@ -89,13 +125,43 @@ class HolidayRepository(BaseRepository):
         self, employee_id: int, start_date: str, end_date: str
     ) -> bool:
         """Check if there's an overlapping request."""
-        result = self._execute_scalar(
-            """SELECT request_id FROM holiday_request
-               WHERE employee_id=:e AND status IN ('PENDING', 'APPROVED')
-               AND NOT (end_date < :start OR start_date > :end)""",
+        hit = self._execute_scalar(
+            """SELECT EXISTS(
+                 SELECT 1 FROM holiday_request
+                 WHERE employee_id=:e AND status IN ('PENDING', 'APPROVED')
+                   AND start_date <= :end AND end_date >= :start
+               )""",
             {"e": employee_id, "start": start_date, "end": end_date},
         )
-        return result is not None
+        return bool(hit)
+
+    def create_request_guarded(
+        self,
+        employee_id: int,
+        start_date: str,
+        end_date: str,
+        days: float,
+        reason: str | None = None,
+    ) -> int | None:
+        """Atomically create a request if balance covers it and no overlap exists.
+
+        Returns the new request ID, or None when a guard rejected the insert.
+        """
+        year = int(start_date[:4])
+        eng = self._get_engine()
+        with eng.begin() as con:
+            row = con.execute(
+                _SQL_CREATE_REQUEST_GUARDED,
+                {
+                    "e": employee_id,
+                    "start": start_date,
+                    "end": end_date,
+                    "days": days,
+                    "reason": reason,
+                    "y": year,
+                },
+            ).first()
+        return row[0] if row else None
 
     def create_request(
         self,
@@ -106,17 +172,18 @@ class HolidayRepository(BaseRepository):
         reason: str | None = None,
     ) -> int:
         """Create a new holiday request. Returns request ID."""
-        return self._execute_insert(
+        return self._execute_insert_returning(
             """INSERT INTO holiday_request
                (employee_id, start_date, end_date, days, status, reason, requested_at)
-               VALUES (:e, :start, :end, :days, 'PENDING', :reason, :now)""",
+               VALUES (:e, :start, :end, :days, 'PENDING', :reason,
+                       strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+               RETURNING request_id""",
             {
                 "e": employee_id,
                 "start": start_date,
                 "end": end_date,
                 "days": days,
                 "reason": reason,
-                "now": datetime.now().isoformat(),
             },
         )
 
@@ -132,36 +199,30 @@ class HolidayRepository(BaseRepository):
         with eng.begin() as con:
             if status in ("APPROVED", "REJECTED"):
                 con.execute(
-                    text(
-                        """UPDATE holiday_request
-                           SET status=:status, reviewed_by=:reviewer, reviewed_at=:now,
-                               rejection_reason=:reason
-                           WHERE request_id=:r"""
-                    ),
+                    _SQL_REVIEW_REQUEST,
                     {
                         "r": request_id,
                         "status": status,
                         "reviewer": reviewer_id,
-                        "now": datetime.now().isoformat(),
                         "reason": reason if status == "REJECTED" else None,
                     },
                 )
             else:
                 con.execute(
-                    text(
-                        "UPDATE holiday_request SET status=:status WHERE request_id=:r"
-                    ),
+                    _SQL_SET_REQUEST_STATUS,
                     {"r": request_id, "status": status},
                 )
         return True
 
     # ========== MANAGER VIEWS ==========
 
-    def get_pending_for_manager(self, manager_id: int) -> list[dict]:
+    def get_pending_for_manager(self, manager_id: int) -> list[HolidayRequestRow]:
         """Get pending requests for a manager's direct reports."""
-        return self._execute_query(
+        return self._execute_query_as(
+            HolidayRequestRow,
             """SELECT hr.request_id, hr.employee_id, e.preferred_name,
-                      hr.start_date, hr.end_date, hr.days, hr.reason, hr.requested_at
+                      hr.start_date, hr.end_date, hr.days, hr.status,
+                      hr.reason, hr.requested_at
                FROM holiday_request hr
                JOIN employee e ON e.employee_id = hr.employee_id
                JOIN manager_reports mr ON mr.report_employee_id = hr.employee_id
@@ -172,32 +233,73 @@ class HolidayRepository(BaseRepository):
 
     def get_request_for_approval(self, manager_id: int, request_id: int) -> dict | None:
         """Get a request that this manager can approve."""
-        return self._execute_query_one(
-            """SELECT hr.request_id, hr.employee_id, hr.status, e.preferred_name
-               FROM holiday_request hr
-               JOIN employee e ON e.employee_id = hr.employee_id
-               JOIN manager_reports mr ON mr.report_employee_id = hr.employee_id
-               WHERE hr.request_id = :r AND mr.manager_employee_id = :m""",
-            {"r": request_id, "m": manager_id},
-        )
+        rows = self.get_requests_for_approval(manager_id, [request_id])
+        return rows[0] if rows else None
+
+    def get_requests_for_approval(
+        self, manager_id: int, request_ids: list[int]
+    ) -> list[dict]:
+        """Get requests that this manager can approve, in one round trip."""
+        if not request_ids:
+            return []
+        eng = self._get_engine()
+        with eng.begin() as con:
+            rows = con.execute(
+                _SQL_REQUESTS_FOR_APPROVAL, {"rids": request_ids, "m": manager_id}
+            ).mappings().all()
+            return [dict(r) for r in rows]
+
+    def review_requests(
+        self,
+        reviewer_id: int,
+        decisions: list[tuple[int, str, str | None]],
+    ) -> None:
+        """Apply a batch of (request_id, status, reason) reviews.
+
+        All updates share one transaction and one prepared statement via
+        executemany, so N approvals cost a single round trip instead of N.
+        """
+        if not decisions:
+            return
+        eng = self._get_engine()
+        with eng.begin() as con:
+            con.execute(
+                _SQL_REVIEW_REQUEST,
+                [
+                    {
+                        "r": request_id,
+                        "status": status,
+                        "reviewer": reviewer_id,
+                        "reason": reason if status == "REJECTED" else None,
+                    }
+                    for request_id, status, reason in decisions
+                ],
+            )
 
     def get_team_calendar(
         self, manager_id: int, year: int, month: int | None = None
-    ) -> list[dict]:
+    ) -> list[HolidayRequestRow]:
         """Get approved time off for team."""
-        date_filter = (
-            f"substr(hr.start_date,1,7) = '{year:04d}-{month:02d}'"
-            if month
-            else f"substr(hr.start_date,1,4) = '{year}'"
-        )
+        # Constant statement text (single cached plan) with the period
+        # expressed as a half-open [start, end) range.
+        if month:
+            range_start = f"{year:04d}-{month:02d}-01"
+            next_year, next_month = (year + 1, 1) if month == 12 else (year, month + 1)
+            range_end = f"{next_year:04d}-{next_month:02d}-01"
+        else:
+            range_start = f"{year:04d}-01-01"
+            range_end = f"{year + 1:04d}-01-01"
 
-        return self._execute_query(
-            f"""SELECT hr.request_id, hr.employee_id, e.preferred_name,
-                       hr.start_date, hr.end_date, hr.days, hr.status
-                FROM holiday_request hr
-                JOIN employee e ON e.employee_id = hr.employee_id
-                JOIN manager_reports mr ON mr.report_employee_id = hr.employee_id
-                WHERE mr.manager_employee_id = :m AND hr.status = 'APPROVED' AND {date_filter}
-                ORDER BY hr.start_date""",
-            {"m": manager_id},
+        return self._execute_query_as(
+            HolidayRequestRow,
+            """SELECT hr.request_id, hr.employee_id, e.preferred_name,
+                      hr.start_date, hr.end_date, hr.days, hr.status,
+                      hr.reason, hr.requested_at
+               FROM holiday_request hr
+               JOIN employee e ON e.employee_id = hr.employee_id
+               JOIN manager_reports mr ON mr.report_employee_id = hr.employee_id
+               WHERE mr.manager_employee_id = :m AND hr.status = 'APPROVED'
+                 AND hr.start_date >= :range_start AND hr.start_date < :range_end
+               ORDER BY hr.start_date""",
+            {"m": manager_id, "range_start": range_start, "range_end": range_end},
         )
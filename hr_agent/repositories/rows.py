@@ -0,0 +1,36 @@
+"""
+Row types - slotted dataclasses for hot read paths
+
+Plain dicts pay a per-row hashtable; these rows are slotted, so repeated
+list endpoints (direct reports, pending approvals, team calendar) hold
+roughly half the memory and read fields by attribute. Services convert
+to dicts with dataclasses.asdict() only at the API/tool boundary.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class EmployeeRow:
+    """One employee in a listing (direct reports, department members)."""
+
+    employee_id: int
+    preferred_name: str
+    email: str
+    title: str
+    department: str
+
+
+@dataclass(slots=True)
+class HolidayRequestRow:
+    """One holiday request in a manager-facing listing."""
+
+    request_id: int
+    employee_id: int
+    preferred_name: str
+    start_date: str
+    end_date: str
+    days: float
+    status: str
+    reason: str | None
+    requested_at: str
@@ -0,0 +1,106 @@
+"""
+Session Repository - Durable chat session storage.
+
+Sessions used to live in a process-local dict inside the API server,
+which fragmented conversations across uvicorn workers. Persisting them
+here, keyed by session_id, lets any worker (or a restarted process)
+resume a conversation.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import text
+
+from .base import BaseRepository
+
+# Correlated subqueries keep session reads to one round trip: the turn
+# count and the first user query (the session title source) come back
+# with the session row itself.
+_SQL_SESSION_SUMMARY = """
+    SELECT s.session_id, s.user_email, s.created_at, s.pending_confirmation,
+           (SELECT COUNT(*) FROM chat_turn t
+            WHERE t.session_id = s.session_id) AS turn_count,
+           (SELECT t.query FROM chat_turn t
+            WHERE t.session_id = s.session_id
+            ORDER BY t.turn_id LIMIT 1) AS first_query
+    FROM chat_session s
+"""
+
+
+class SessionRepository(BaseRepository):
+    """Repository for chat sessions and their turn history."""
+
+    def create(self, session_id: str, user_email: str) -> dict:
+        """Create a session and return its summary row."""
+        created_at = datetime.utcnow().isoformat()
+        self._execute_insert(
+            """INSERT INTO chat_session
+               (session_id, user_email, created_at, pending_confirmation)
+               VALUES (:session_id, :user_email, :created_at, NULL)""",
+            {
+                "session_id": session_id,
+                "user_email": user_email,
+                "created_at": created_at,
+            },
+        )
+        return {
+            "session_id": session_id,
+            "user_email": user_email,
+            "created_at": created_at,
+            "pending_confirmation": None,
+            "turn_count": 0,
+            "first_query": None,
+        }
+
+    def get(self, session_id: str) -> dict | None:
+        """Fetch a session summary (with turn count and first query)."""
+        return self._execute_query_one(
+            _SQL_SESSION_SUMMARY + " WHERE s.session_id = :session_id",
+            {"session_id": session_id},
+        )
+
+    def list_for_user(self, user_email: str) -> list[dict]:
+        """List session summaries for a user, newest first."""
+        return self._execute_query(
+            _SQL_SESSION_SUMMARY
+            + """ WHERE s.user_email = :user_email
+                  ORDER BY s.created_at DESC""",
+            {"user_email": user_email},
+        )
+
+    def append_turn(self, session_id: str, query: str, response: str) -> int:
+        """Record one query/response turn for a session."""
+        return self._execute_insert(
+            """INSERT INTO chat_turn (session_id, query, response, created_at)
+               VALUES (:session_id, :query, :response, :created_at)""",
+            {
+                "session_id": session_id,
+                "query": query,
+                "response": response,
+                "created_at": datetime.utcnow().isoformat(),
+            },
+        )
+
+    def list_turns(self, session_id: str) -> list[dict]:
+        """List a session's turns in conversation order."""
+        return self._execute_query(
+            """SELECT query, response, created_at
+               FROM chat_turn
+               WHERE session_id = :session_id
+               ORDER BY turn_id""",
+            {"session_id": session_id},
+        )
+
+    def delete(self, session_id: str) -> bool:
+        """Delete a session and its turns atomically."""
+        eng = self._get_engine()
+        with eng.begin() as con:
+            con.execute(
+                text("DELETE FROM chat_turn WHERE session_id = :session_id"),
+                {"session_id": session_id},
+            )
+            result = con.execute(
+                text("DELETE FROM chat_session WHERE session_id = :session_id"),
+                {"session_id": session_id},
+            )
+            return result.rowcount > 0
@@ -4,14 +4,37 @@ from .utils.db import get_engine
 
 def _ensure_sqlite_column(con, table_name: str, column_name: str, ddl: str) -> None:
     """Add a column for SQLite tables when upgrading existing local DBs."""
+    # table_xinfo also lists hidden/generated columns, unlike table_info.
     columns = {
         row["name"]
-        for row in con.execute(text(f"PRAGMA table_info({table_name})")).mappings().all()
+        for row in con.execute(text(f"PRAGMA table_xinfo({table_name})")).mappings().all()
     }
     if column_name not in columns:
         con.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {ddl}"))
 
 
+def _backfill_identity_columns(con) -> None:
+    """Denormalize identity_map/app_role_map onto employee for 1-probe lookups."""
+    con.execute(
+        text(
+            """UPDATE employee
+               SET user_email = (SELECT im.user_email FROM identity_map im
+                                 WHERE im.employee_id = employee.employee_id)
+               WHERE user_email IS NULL"""
+        )
+    )
+    con.execute(
+        text(
+            """UPDATE employee
+               SET app_role = COALESCE(
+                     (SELECT ar.app_role FROM app_role_map ar
+                      WHERE ar.user_email = employee.user_email),
+                     'EMPLOYEE')
+               WHERE app_role IS NULL"""
+        )
+    )
+
+
 def seed_if_needed() -> None:
     eng = get_engine()
     with eng.begin() as con:
@@ -35,6 +58,63 @@ def seed_if_needed() -> None:
             )
         )
 
+        # Full-text index over the searchable employee columns, kept in sync
+        # with triggers (external-content FTS5 table).
+        con.execute(
+            text(
+                """
+        CREATE VIRTUAL TABLE IF NOT EXISTS employee_fts USING fts5(
+          preferred_name, legal_name, email, title,
+          content='employee', content_rowid='employee_id'
+        );
+        """
+            )
+        )
+        con.execute(
+            text(
+                """
+        CREATE TRIGGER IF NOT EXISTS employee_fts_ai AFTER INSERT ON employee BEGIN
+          INSERT INTO employee_fts(rowid, preferred_name, legal_name, email, title)
+          VALUES (new.employee_id, new.preferred_name, new.legal_name, new.email, new.title);
+        END;
+        """
+            )
+        )
+        con.execute(
+            text(
+                """
+        CREATE TRIGGER IF NOT EXISTS employee_fts_ad AFTER DELETE ON employee BEGIN
+          INSERT INTO employee_fts(employee_fts, rowid, preferred_name, legal_name, email, title)
+          VALUES ('delete', old.employee_id, old.preferred_name, old.legal_name, old.email, old.title);
+        END;
+        """
+            )
+        )
+        con.execute(
+            text(
+                """
+        CREATE TRIGGER IF NOT EXISTS employee_fts_au AFTER UPDATE ON employee BEGIN
+          INSERT INTO employee_fts(employee_fts, rowid, preferred_name, legal_name, email, title)
+          VALUES ('delete', old.employee_id, old.preferred_name, old.legal_name, old.email, old.title);
+          INSERT INTO employee_fts(rowid, preferred_name, legal_name, email, title)
+          VALUES (new.employee_id, new.preferred_name, new.legal_name, new.email, new.title);
+        END;
+        """
+            )
+        )
+        # Rebuild the index for pre-existing DBs that were seeded before the
+        # FTS table (and its triggers) existed. Counting employee_fts itself
+        # would read through to the content table, so count the shadow
+        # docsize table, which tracks actually-indexed documents.
+        fts_count = con.execute(
+            text("SELECT count(*) FROM employee_fts_docsize")
+        ).scalar_one()
+        emp_count = con.execute(text("SELECT count(*) FROM employee")).scalar_one()
+        if fts_count != emp_count:
+            con.execute(
+                text("INSERT INTO employee_fts(employee_fts) VALUES('rebuild')")
+            )
+
         con.execute(
             text(
                 """
@@ -97,7 +177,8 @@ def seed_if_needed() -> None:
           requested_at TEXT NOT NULL,
           reviewed_by INTEGER NULL,
           reviewed_at TEXT NULL,
-          rejection_reason TEXT NULL
+          rejection_reason TEXT NULL,
+          year INTEGER GENERATED ALWAYS AS (CAST(substr(start_date,1,4) AS INTEGER)) VIRTUAL
         );
         """
             )
@@ -370,7 +451,86 @@ def seed_if_needed() -> None:
             )
         )
 
+        con.execute(
+            text(
+                """
+        CREATE TABLE IF NOT EXISTS chat_session (
+          session_id TEXT PRIMARY KEY,
+          user_email TEXT NOT NULL,
+          created_at TEXT NOT NULL,
+          pending_confirmation TEXT NULL
+        );
+        """
+            )
+        )
+
+        con.execute(
+            text(
+                """
+        CREATE TABLE IF NOT EXISTS chat_turn (
+          turn_id INTEGER PRIMARY KEY AUTOINCREMENT,
+          session_id TEXT NOT NULL,
+          query TEXT NOT NULL,
+          response TEXT NOT NULL,
+          created_at TEXT NOT NULL,
+          FOREIGN KEY (session_id) REFERENCES chat_session(session_id)
+        );
+        """
+            )
+        )
+
+        con.execute(
+            text(
+                """
+        CREATE INDEX IF NOT EXISTS ix_chat_session_user
+          ON chat_session(user_email, created_at DESC);
+        """
+            )
+        )
+
+        con.execute(
+            text(
+                """
+        CREATE INDEX IF NOT EXISTS ix_chat_turn_session
+          ON chat_turn(session_id, turn_id);
+        """
+            )
+        )
+
         # Migration-safe column upgrades for existing local DBs.
+        _ensure_sqlite_column(con, "employee", "user_email", "user_email TEXT NULL")
+        _ensure_sqlite_column(con, "employee", "app_role", "app_role TEXT NULL")
+        con.execute(
+            text(
+                """
+        CREATE UNIQUE INDEX IF NOT EXISTS ix_emp_user_email
+          ON employee(user_email);
+        """
+            )
+        )
+        _ensure_sqlite_column(
+            con,
+            "holiday_request",
+            "year",
+            "year INTEGER GENERATED ALWAYS AS (CAST(substr(start_date,1,4) AS INTEGER)) VIRTUAL",
+        )
+        con.execute(
+            text(
+                """
+        CREATE INDEX IF NOT EXISTS ix_hr_emp_year_status
+          ON holiday_request(employee_id, year, status);
+        """
+            )
+        )
+        con.execute(
+            text(
+                """
+        CREATE INDEX IF NOT EXISTS ix_hr_overlap
+          ON holiday_request(employee_id, status, start_date, end_date)
+          WHERE status IN ('PENDING', 'APPROVED');
+        """
+            )
+        )
         _ensure_sqlite_column(
             con, "hr_escalation_request", "priority", "priority TEXT NOT NULL DEFAULT 'MEDIUM'"
         )
@@ -460,6 +620,7 @@ def seed_if_needed() -> None:
             .one()["c"]
         )
         if existing > 0:
+            _backfill_identity_columns(con)
             return
 
         # ============================================================================
@@ -468,7 +629,10 @@ def seed_if_needed() -> None:
         con.execute(
             text(
                 """
-        INSERT INTO employee VALUES
+        INSERT INTO employee
+          (employee_id, legal_name, preferred_name, email, title, department,
+           location, hire_date, employment_status, manager_employee_id, cost_center)
+        VALUES
           -- Executive Team
           (100,'Jordan Lee','Jordan','jordan.lee@acme.com','CEO','Executive','Berlin','2018-03-12','ACTIVE',NULL,'CC-EXEC'),
           (101,'Victoria Adams','Victoria','victoria.adams@acme.com','COO','Executive','Berlin','2018-09-15','ACTIVE',100,'CC-EXEC'),
@@ -1295,3 +1459,12 @@ def seed_if_needed() -> None:
         """
             )
         )
+
+        _backfill_identity_columns(con)
+
+
+if __name__ == "__main__":
+    # One-shot entrypoint (`python -m hr_agent.seed`) so production
+    # deployments seed once before launching workers instead of racing
+    # inside each worker's startup.
+    seed_if_needed()
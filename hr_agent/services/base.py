@@ -10,9 +10,11 @@ Benefits:
 - Clear, readable operations without SQL
 """
 
+from dataclasses import asdict
 from datetime import datetime, date, timedelta
-from functools import cmp_to_key
+from functools import cache, cmp_to_key
 from typing import Any
+from ..utils.decorators import cache_result
 from ..repositories import (
     get_employee_repo,
     get_holiday_repo,
@@ -23,6 +25,54 @@ from ..repositories import (
 )
 
 
+# ============================================================================
+# IDENTITY LOOKUP CACHES
+# ============================================================================
+
+# Identity and role mappings are small and change rarely, yet they are
+# consulted on every agent turn. Cache the point lookups process-wide
+# with a TTL so role or reporting changes take effect within minutes
+# without a restart; clear_identity_caches() forces it immediately.
+
+
+@cache_result(ttl_seconds=300, max_entries=2048)
+def _lookup_employee_id(email: str) -> int | None:
+    return get_employee_repo().get_employee_id_by_email(email)
+
+
+@cache_result(ttl_seconds=300, max_entries=2048)
+def _lookup_role(email: str) -> str:
+    return get_employee_repo().get_role_by_email(email)
+
+
+@cache_result(ttl_seconds=300, max_entries=2048)
+def _lookup_requester_context(email: str) -> dict:
+    bundle = get_employee_repo().get_requester_bundle(email)
+    if bundle is None:
+        raise ValueError(f"No employee found for email: {email}")
+
+    role = bundle["role"]
+
+    direct_reports = []
+    if role in ("MANAGER", "HR") and bundle["reports"]:
+        direct_reports = [int(r) for r in bundle["reports"].split(",")]
+
+    return {
+        "user_email": email,
+        "employee_id": bundle["employee_id"],
+        "name": bundle["preferred_name"] or "Unknown",
+        "role": role,
+        "direct_reports": direct_reports,
+    }
+
+
+def clear_identity_caches() -> None:
+    """Invalidate cached identity/role lookups (call after admin changes)."""
+    _lookup_employee_id.clear_cache()
+    _lookup_role.clear_cache()
+    _lookup_requester_context.clear_cache()
+
+
 # ============================================================================
 # EMPLOYEE SERVICE
 # ============================================================================
@@ -31,6 +81,8 @@ from ..repositories import (
 class EmployeeService:
     """Service for employee and organization operations."""
 
+    __slots__ = ("repo",)
+
     def __init__(self):
         self.repo = get_employee_repo()
 
@@ -52,7 +104,7 @@ class EmployeeService:
 
     def get_direct_reports(self, manager_id: int) -> list[dict]:
         """Get all direct reports for a manager."""
-        return self.repo.get_direct_reports(manager_id)
+        return [asdict(row) for row in self.repo.get_direct_reports(manager_id)]
 
     def get_manager_chain(self, employee_id: int, max_depth: int = 6) -> list[dict]:
         """Get the full management chain up to CEO."""
@@ -74,27 +126,22 @@ class EmployeeService:
         """Get employee's cost center."""
         return self.repo.get_cost_center(employee_id)
 
-    def get_requester_context(self, user_email: str) -> dict:
-        """Get full context for a requester (used by agent)."""
-        emp_id = self.repo.get_employee_id_by_email(user_email)
-        if emp_id is None:
-            raise ValueError(f"No employee found for email: {user_email}")
+    def get_employee_id_by_email(self, email: str) -> int | None:
+        """Get employee ID for an email (cached point lookup)."""
+        return _lookup_employee_id(email)
 
-        role = self.repo.get_role_by_email(user_email)
-        emp = self.repo.get_by_id(emp_id)
-        name = emp["preferred_name"] if emp else "Unknown"
+    def get_role_by_email(self, email: str) -> str:
+        """Get app role for an email (cached point lookup)."""
+        return _lookup_role(email)
 
-        direct_reports = []
-        if role in ("MANAGER", "HR"):
-            direct_reports = self.repo.get_direct_report_ids(emp_id)
+    def get_requester_context(self, user_email: str) -> dict:
+        """Get full context for a requester (used by agent).
 
-        return {
-            "user_email": user_email,
-            "employee_id": emp_id,
-            "name": name,
-            "role": role,
-            "direct_reports": direct_reports,
-        }
+        Cached point lookup — a fresh agent is constructed per API
+        request, so this runs on every chat turn. Callers must treat
+        the returned dict as read-only.
+        """
+        return _lookup_requester_context(user_email)
 
 
 # ============================================================================
@@ -105,6 +152,8 @@ class EmployeeService:
 class HolidayService:
     """Service for holiday/time-off operations."""
 
+    __slots__ = ("repo",)
+
     def __init__(self):
         self.repo = get_holiday_repo()
 
@@ -127,8 +176,8 @@ class HolidayService:
         """Submit a new holiday request."""
         # Validate dates
         try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+            start = date.fromisoformat(start_date)
+            end = date.fromisoformat(end_date)
         except ValueError:
             return {"success": False, "error": "Invalid date format. Use YYYY-MM-DD."}
 
@@ -137,26 +186,26 @@ class HolidayService:
         if start < date.today():
             return {"success": False, "error": "Cannot request time off in the past."}
 
-        # Check balance
-        balance = self.get_balance(employee_id, start.year)
-        if balance["remaining"] < days:
-            return {
-                "success": False,
-                "error": f"Insufficient balance. You have {balance['remaining']} days remaining but requested {days} days.",
-            }
-
-        # Check for overlapping requests
-        if self.repo.has_overlapping_request(employee_id, start_date, end_date):
-            return {
-                "success": False,
-                "error": "You already have a request overlapping these dates.",
-            }
-
-        # Create request
-        request_id = self.repo.create_request(
+        # Balance check, overlap check, and insert happen atomically in one
+        # guarded statement; the guards are only re-read on rejection.
+        request_id = self.repo.create_request_guarded(
             employee_id, start_date, end_date, days, reason
         )
 
+        if request_id is None:
+            balance = self.get_balance(employee_id, start.year)
+            if balance["remaining"] < days:
+                return {
+                    "success": False,
+                    "error": f"Insufficient balance. You have {balance['remaining']} days remaining but requested {days} days.",
+                }
+            if self.repo.has_overlapping_request(employee_id, start_date, end_date):
+                return {
+                    "success": False,
+                    "error": "You already have a request overlapping these dates.",
+                }
+            return {"success": False, "error": "Unable to submit holiday request."}
+
         return {
             "success": True,
             "request_id": request_id,
@@ -178,7 +227,7 @@ class HolidayService:
         if request["status"] == "REJECTED":
             return {"success": False, "error": "Cannot cancel a rejected request."}
 
-        start = datetime.strptime(request["start_date"], "%Y-%m-%d").date()
+        start = date.fromisoformat(request["start_date"])
         if start < date.today():
             return {"success": False, "error": "Cannot cancel past time off."}
 
@@ -191,7 +240,7 @@ class HolidayService:
 
     def get_pending_approvals(self, manager_id: int) -> list[dict]:
         """Get pending requests for a manager's direct reports."""
-        return self.repo.get_pending_for_manager(manager_id)
+        return [asdict(row) for row in self.repo.get_pending_for_manager(manager_id)]
 
     def approve_request(self, manager_id: int, request_id: int) -> dict:
         """Approve a holiday request."""
@@ -239,11 +288,84 @@ class HolidayService:
             "message": f"Holiday request for {request['preferred_name']} has been rejected.",
         }
 
+    def review_requests(self, manager_id: int, actions: list[dict]) -> dict:
+        """Approve/reject a batch of holiday requests in two round trips.
+
+        Each action is {"request_id", "action": "approve"|"reject",
+        "reason"?}. Authorization and status for every request are read
+        with one IN query, and all eligible reviews are written with one
+        batched UPDATE; per-request outcomes are reported individually.
+        """
+        if not actions:
+            return {"success": False, "error": "No actions provided."}
+
+        request_ids = []
+        for action in actions:
+            request_id = action.get("request_id")
+            verb = action.get("action")
+            if not isinstance(request_id, int) or verb not in ("approve", "reject"):
+                return {
+                    "success": False,
+                    "error": "Each action needs a request_id and an action of 'approve' or 'reject'.",
+                }
+            request_ids.append(request_id)
+
+        requests = {
+            r["request_id"]: r
+            for r in self.repo.get_requests_for_approval(manager_id, request_ids)
+        }
+
+        results = []
+        decisions = []
+        for action in actions:
+            request_id = action["request_id"]
+            request = requests.get(request_id)
+            if not request:
+                results.append(
+                    {
+                        "request_id": request_id,
+                        "success": False,
+                        "error": "Request not found or you're not the manager.",
+                    }
+                )
+                continue
+            if request["status"] != "PENDING":
+                results.append(
+                    {
+                        "request_id": request_id,
+                        "success": False,
+                        "error": f"Request is already {request['status']}.",
+                    }
+                )
+                continue
+            status = "APPROVED" if action["action"] == "approve" else "REJECTED"
+            decisions.append((request_id, status, action.get("reason")))
+            results.append(
+                {
+                    "request_id": request_id,
+                    "success": True,
+                    "message": f"Holiday request for {request['preferred_name']} has been {status.lower()}.",
+                }
+            )
+            # Guard against the same request appearing twice in one batch.
+            request["status"] = status
+
+        self.repo.review_requests(manager_id, decisions)
+
+        applied = len(decisions)
+        return {
+            "success": applied > 0,
+            "message": f"Applied {applied} of {len(actions)} holiday actions.",
+            "results": results,
+        }
+
     def get_team_calendar(
         self, manager_id: int, year: int, month: int | None = None
     ) -> list[dict]:
         """Get approved time off for the team."""
-        return self.repo.get_team_calendar(manager_id, year, month)
+        return [
+            asdict(row) for row in self.repo.get_team_calendar(manager_id, year, month)
+        ]
 
 
 # ============================================================================
@@ -254,6 +376,8 @@ class HolidayService:
 class CompensationService:
     """Service for compensation operations."""
 
+    __slots__ = ("repo",)
+
     def __init__(self):
         self.repo = get_compensation_repo()
 
@@ -278,6 +402,8 @@ class CompensationService:
 class CompanyService:
     """Service for company-wide information."""
 
+    __slots__ = ("repo",)
+
     def __init__(self):
         self.repo = get_company_repo()
 
@@ -317,7 +443,9 @@ class EscalationService:
         "IN_REVIEW": {"RESOLVED"},
         "RESOLVED": {"IN_REVIEW"},
     }
-    TRIAGE_ROLES = {"HR", "MANAGER"}
+    TRIAGE_ROLES = frozenset({"HR", "MANAGER"})
+
+    __slots__ = ("repo", "employee_repo")
 
     def __init__(self):
         self.repo = get_escalation_repo()
@@ -648,7 +776,7 @@ class HRRequestService:
         "RESOLVED": {"IN_PROGRESS"},
         "CANCELLED": set(),
     }
-    TRIAGE_ROLES = {"HR", "MANAGER"}
+    TRIAGE_ROLES = frozenset({"HR", "MANAGER"})
     DEFAULT_REQUIRED_FIELDS = [
         "summary",
         "description",
@@ -660,15 +788,14 @@ class HRRequestService:
         {
             "type": "CLAIMS",
             "subtype": "TRAVEL",
-            "keywords": [
-                "reimbursement",
+            "keywords": (
                 "reimburs",
                 "expense claim",
                 "travel claim",
                 "taxi",
                 "uber",
                 "lyft",
-            ],
+            ),
             "priority": "P1",
             "risk_level": "MED",
             "sla_hours": 72,
@@ -678,15 +805,13 @@ class HRRequestService:
         {
             "type": "PAYROLL",
             "subtype": "DEDUCTION_QUERY",
-            "keywords": [
+            "keywords": (
+                "deduction",
                 "salary lower",
-                "why is my salary lower",
                 "net pay lower",
-                "payroll deduction",
-                "deduction",
                 "salary less",
                 "paid less",
-            ],
+            ),
             "priority": "P0",
             "risk_level": "HIGH",
             "sla_hours": 24,
@@ -696,13 +821,12 @@ class HRRequestService:
         {
             "type": "POLICY",
             "subtype": "REMOTE_WORK",
-            "keywords": [
+            "keywords": (
                 "remote policy",
+                "remote work policy",
                 "work from home policy",
                 "wfh policy",
-                "remote work policy",
-                "what is remote policy",
-            ],
+            ),
             "priority": "P2",
             "risk_level": "LOW",
             "sla_hours": 120,
@@ -711,6 +835,8 @@ class HRRequestService:
         },
     ]
 
+    __slots__ = ("repo", "employee_repo")
+
     def __init__(self):
         self.repo = get_hr_request_repo()
         self.employee_repo = get_employee_repo()
@@ -782,7 +908,9 @@ class HRRequestService:
         return (datetime.now() + timedelta(hours=hours_from_now)).isoformat()
 
     def _match_employee_profile(self, text: str) -> dict[str, Any] | None:
-        lower = text.lower()
+        # islower() is an allocation-free C scan; chat input is usually
+        # already lowercase, so skip the copy when it is.
+        lower = text if text.islower() else text.lower()
         for profile in self.EMPLOYEE_INTAKE_PROFILES:
             if any(keyword in lower for keyword in profile["keywords"]):
                 return profile
@@ -1287,51 +1415,35 @@ class HRRequestService:
 # SERVICE SINGLETONS
 # ============================================================================
 
-_employee_service: EmployeeService | None = None
-_holiday_service: HolidayService | None = None
-_compensation_service: CompensationService | None = None
-_company_service: CompanyService | None = None
-_escalation_service: EscalationService | None = None
-_hr_request_service: HRRequestService | None = None
+# functools.cache does the None-check in C, which matters on the agent hot
+# path where these accessors run once per tool call.
 
 
+@cache
 def get_employee_service() -> EmployeeService:
-    global _employee_service
-    if _employee_service is None:
-        _employee_service = EmployeeService()
-    return _employee_service
+    return EmployeeService()
 
 
+@cache
 def get_holiday_service() -> HolidayService:
-    global _holiday_service
-    if _holiday_service is None:
-        _holiday_service = HolidayService()
-    return _holiday_service
+    return HolidayService()
 
 
+@cache
 def get_compensation_service() -> CompensationService:
-    global _compensation_service
-    if _compensation_service is None:
-        _compensation_service = CompensationService()
-    return _compensation_service
+    return CompensationService()
 
 
+@cache
 def get_company_service() -> CompanyService:
-    global _company_service
-    if _company_service is None:
-        _company_service = CompanyService()
-    return _company_service
+    return CompanyService()
 
 
+@cache
 def get_escalation_service() -> EscalationService:
-    global _escalation_service
-    if _escalation_service is None:
-        _escalation_service = EscalationService()
-    return _escalation_service
+    return EscalationService()
 
 
+@cache
 def get_hr_request_service() -> HRRequestService:
-    global _hr_request_service
-    if _hr_request_service is None:
-        _hr_request_service = HRRequestService()
-    return _hr_request_service
+    return HRRequestService()
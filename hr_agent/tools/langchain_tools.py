@@ -11,9 +11,11 @@ Benefits:
 - Traceable with LangSmith
 """
 
-from typing import Optional
+import threading
+import time
+from types import MappingProxyType
+
 from langchain_core.tools import tool
-from pydantic import BaseModel, Field
 
 from ..services.base import (
     get_employee_service,
@@ -24,97 +26,226 @@ from ..services.base import (
 
 
 # ============================================================================
-# INPUT SCHEMAS (Pydantic models for structured tool inputs)
+# INPUT SCHEMAS (plain JSON schemas for structured tool inputs)
 # ============================================================================
 
-
-class EmployeeSearchInput(BaseModel):
-    """Input for searching employees."""
-
-    query: str = Field(description="Search query - can be name, email, or job title")
-    limit: int = Field(default=10, description="Maximum number of results to return")
-
-
-class EmployeeIdInput(BaseModel):
-    """Input for employee-specific operations."""
-
-    employee_id: int = Field(description="The unique employee ID")
-
-
-class HolidayBalanceInput(BaseModel):
-    """Input for checking holiday balance."""
-
-    employee_id: int = Field(description="The employee ID to check balance for")
-    year: int = Field(description="The year to check balance for (e.g., 2026)")
-
-
-class HolidayRequestInput(BaseModel):
-    """Input for submitting a holiday request."""
-
-    employee_id: int = Field(description="The employee ID submitting the request")
-    start_date: str = Field(description="Start date in YYYY-MM-DD format")
-    end_date: str = Field(description="End date in YYYY-MM-DD format")
-    days: float = Field(description="Number of days requested")
-    reason: Optional[str] = Field(
-        default=None, description="Optional reason for the request"
-    )
-
-
-class HolidayActionInput(BaseModel):
-    """Input for holiday request actions (cancel/approve/reject)."""
-
-    employee_id: int = Field(
-        description="The employee or manager ID performing the action"
-    )
-    request_id: int = Field(description="The holiday request ID")
-    reason: Optional[str] = Field(
-        default=None, description="Optional reason (for rejection)"
-    )
-
-
-class TeamCalendarInput(BaseModel):
-    """Input for team calendar view."""
-
-    manager_employee_id: int = Field(description="The manager's employee ID")
-    year: int = Field(description="The year to view")
-    month: Optional[int] = Field(
-        default=None, description="Optional specific month (1-12)"
-    )
-
-
-class DepartmentInput(BaseModel):
-    """Input for department queries."""
-
-    department: str = Field(
-        description="Department name (e.g., 'Engineering', 'Sales', 'HR')"
-    )
-
-
-class OrgChartInput(BaseModel):
-    """Input for org chart retrieval."""
-
-    root_employee_id: Optional[int] = Field(
-        default=None, description="Starting employee ID (defaults to CEO)"
-    )
-    max_depth: int = Field(default=3, description="Maximum depth of the org chart")
-
-
-class PolicyInput(BaseModel):
-    """Input for policy details."""
-
-    policy_id: int = Field(description="The policy ID to retrieve")
-
-
-class YearInput(BaseModel):
-    """Input for year-based queries."""
-
-    year: int = Field(description="The year to query (e.g., 2026)")
-
-
-class LimitInput(BaseModel):
-    """Input for queries with a limit."""
-
-    limit: int = Field(default=10, description="Maximum number of results")
+# These exist only to describe arguments to the LLM; passing them as JSON
+# schema dicts lets LangChain skip building and validating a Pydantic model
+# on every tool invocation.
+
+
+EmployeeSearchInput = {
+    "title": "EmployeeSearchInput",
+    "description": "Input for searching employees.",
+    "type": "object",
+    "properties": {
+        "query": {
+            "type": "string",
+            "description": "Search query - can be name, email, or job title",
+        },
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of results to return",
+            "default": 10,
+        },
+    },
+    "required": ["query"],
+}
+
+EmployeeIdInput = {
+    "title": "EmployeeIdInput",
+    "description": "Input for employee-specific operations.",
+    "type": "object",
+    "properties": {
+        "employee_id": {"type": "integer", "description": "The unique employee ID"},
+    },
+    "required": ["employee_id"],
+}
+
+HolidayBalanceInput = {
+    "title": "HolidayBalanceInput",
+    "description": "Input for checking holiday balance.",
+    "type": "object",
+    "properties": {
+        "employee_id": {
+            "type": "integer",
+            "description": "The employee ID to check balance for",
+        },
+        "year": {
+            "type": "integer",
+            "description": "The year to check balance for (e.g., 2026)",
+        },
+    },
+    "required": ["employee_id", "year"],
+}
+
+HolidayRequestInput = {
+    "title": "HolidayRequestInput",
+    "description": "Input for submitting a holiday request.",
+    "type": "object",
+    "properties": {
+        "employee_id": {
+            "type": "integer",
+            "description": "The employee ID submitting the request",
+        },
+        "start_date": {
+            "type": "string",
+            "description": "Start date in YYYY-MM-DD format",
+        },
+        "end_date": {
+            "type": "string",
+            "description": "End date in YYYY-MM-DD format",
+        },
+        "days": {"type": "number", "description": "Number of days requested"},
+        "reason": {
+            "type": "string",
+            "description": "Optional reason for the request",
+            "default": None,
+        },
+    },
+    "required": ["employee_id", "start_date", "end_date", "days"],
+}
+
+HolidayActionInput = {
+    "title": "HolidayActionInput",
+    "description": "Input for holiday request actions (cancel/approve/reject).",
+    "type": "object",
+    "properties": {
+        "employee_id": {
+            "type": "integer",
+            "description": "The employee or manager ID performing the action",
+        },
+        "request_id": {"type": "integer", "description": "The holiday request ID"},
+        "reason": {
+            "type": "string",
+            "description": "Optional reason (for rejection)",
+            "default": None,
+        },
+    },
+    "required": ["employee_id", "request_id"],
+}
+
+BatchHolidayActionInput = {
+    "title": "BatchHolidayActionInput",
+    "description": "Input for reviewing several holiday requests at once.",
+    "type": "object",
+    "properties": {
+        "manager_employee_id": {
+            "type": "integer",
+            "description": "The manager's employee ID",
+        },
+        "actions": {
+            "type": "array",
+            "description": "One entry per request to review",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "request_id": {
+                        "type": "integer",
+                        "description": "The holiday request ID",
+                    },
+                    "action": {
+                        "type": "string",
+                        "enum": ["approve", "reject"],
+                        "description": "Decision for this request",
+                    },
+                    "reason": {
+                        "type": "string",
+                        "description": "Optional reason (for rejection)",
+                        "default": None,
+                    },
+                },
+                "required": ["request_id", "action"],
+            },
+        },
+    },
+    "required": ["manager_employee_id", "actions"],
+}
+
+TeamCalendarInput = {
+    "title": "TeamCalendarInput",
+    "description": "Input for team calendar view.",
+    "type": "object",
+    "properties": {
+        "manager_employee_id": {
+            "type": "integer",
+            "description": "The manager's employee ID",
+        },
+        "year": {"type": "integer", "description": "The year to view"},
+        "month": {
+            "type": "integer",
+            "description": "Optional specific month (1-12)",
+            "default": None,
+        },
+    },
+    "required": ["manager_employee_id", "year"],
+}
+
+DepartmentInput = {
+    "title": "DepartmentInput",
+    "description": "Input for department queries.",
+    "type": "object",
+    "properties": {
+        "department": {
+            "type": "string",
+            "description": "Department name (e.g., 'Engineering', 'Sales', 'HR')",
+        },
+    },
+    "required": ["department"],
+}
+
+OrgChartInput = {
+    "title": "OrgChartInput",
+    "description": "Input for org chart retrieval.",
+    "type": "object",
+    "properties": {
+        "root_employee_id": {
+            "type": "integer",
+            "description": "Starting employee ID (defaults to CEO)",
+            "default": None,
+        },
+        "max_depth": {
+            "type": "integer",
+            "description": "Maximum depth of the org chart",
+            "default": 3,
+        },
+    },
+    "required": [],
+}
+
+PolicyInput = {
+    "title": "PolicyInput",
+    "description": "Input for policy details.",
+    "type": "object",
+    "properties": {
+        "policy_id": {"type": "integer", "description": "The policy ID to retrieve"},
+    },
+    "required": ["policy_id"],
+}
+
+YearInput = {
+    "title": "YearInput",
+    "description": "Input for year-based queries.",
+    "type": "object",
+    "properties": {
+        "year": {"type": "integer", "description": "The year to query (e.g., 2026)"},
+    },
+    "required": ["year"],
+}
+
+LimitInput = {
+    "title": "LimitInput",
+    "description": "Input for queries with a limit.",
+    "type": "object",
+    "properties": {
+        "limit": {
+            "type": "integer",
+            "description": "Maximum number of results",
+            "default": 10,
+        },
+    },
+    "required": [],
+}
 
 
 # ============================================================================
@@ -365,6 +496,24 @@ def reject_holiday_request(
     return get_holiday_service().reject_request(manager_employee_id, request_id, reason)
 
 
+@tool(args_schema=BatchHolidayActionInput)
+def batch_holiday_action(manager_employee_id: int, actions: list[dict]) -> dict:
+    """Approve and/or reject several holiday requests in one call (manager only).
+
+    Use this tool when:
+    - Manager wants to act on more than one pending request at once
+      (e.g. "approve all three of those" or "approve 12 and reject 15")
+
+    Each action is {"request_id": int, "action": "approve" | "reject",
+    "reason": optional str}.
+
+    IMPORTANT: This action requires confirmation before execution.
+
+    Returns: per-request outcomes plus an overall summary
+    """
+    return get_holiday_service().review_requests(manager_employee_id, actions)
+
+
 @tool(args_schema=TeamCalendarInput)
 def get_team_calendar(
     manager_employee_id: int, year: int, month: int | None = None
@@ -436,6 +585,35 @@ def get_team_compensation_summary(manager_employee_id: int) -> dict:
 # COMPANY POLICIES & INFO
 # ============================================================================
 
+# Policies, holidays, announcements, and events change at most daily, yet a
+# chatty conversation can request them several times. Serve repeats from a
+# small TTL cache instead of round-tripping to the DB each time.
+
+_STATIC_TTL_SECONDS = 300.0
+_STATIC_CACHE_MAX = 256
+_static_cache: dict[tuple, tuple] = {}
+_static_cache_lock = threading.Lock()
+
+
+def _cached_static(key: tuple, supplier):
+    now = time.monotonic()
+    with _static_cache_lock:
+        hit = _static_cache.get(key)
+        if hit is not None and hit[1] > now:
+            return hit[0]
+    value = supplier()
+    with _static_cache_lock:
+        if len(_static_cache) >= _STATIC_CACHE_MAX:
+            _static_cache.pop(next(iter(_static_cache)))
+        _static_cache[key] = (value, now + _STATIC_TTL_SECONDS)
+    return value
+
+
+def clear_static_tool_cache() -> None:
+    """Drop cached company-info results (call after editing that data)."""
+    with _static_cache_lock:
+        _static_cache.clear()
+
 
 @tool
 def get_company_policies() -> list[dict]:
@@ -447,7 +625,7 @@ def get_company_policies() -> list[dict]:
 
     Returns: list of policies with id, name, and category
     """
-    return get_company_service().get_policies()
+    return _cached_static(("policies",), get_company_service().get_policies)
 
 
 @tool(args_schema=PolicyInput)
@@ -460,7 +638,10 @@ def get_policy_details(policy_id: int) -> dict | None:
 
     Returns: full policy text and metadata
     """
-    return get_company_service().get_policy_details(policy_id)
+    return _cached_static(
+        ("policy", policy_id),
+        lambda: get_company_service().get_policy_details(policy_id),
+    )
 
 
 @tool(args_schema=YearInput)
@@ -474,7 +655,7 @@ def get_company_holidays(year: int) -> list[dict]:
 
     Returns: list of holiday dates and names
     """
-    return get_company_service().get_holidays(year)
+    return _cached_static(("holidays", year), lambda: get_company_service().get_holidays(year))
 
 
 # ============================================================================
@@ -492,7 +673,10 @@ def get_announcements(limit: int = 10) -> list[dict]:
 
     Returns: list of recent announcements
     """
-    return get_company_service().get_announcements(limit)
+    return _cached_static(
+        ("announcements", limit),
+        lambda: get_company_service().get_announcements(limit),
+    )
 
 
 @tool
@@ -505,7 +689,10 @@ def get_upcoming_events(days_ahead: int = 30) -> list[dict]:
 
     Returns: list of upcoming events with dates
     """
-    return get_company_service().get_upcoming_events(days_ahead)
+    return _cached_static(
+        ("events", days_ahead),
+        lambda: get_company_service().get_upcoming_events(days_ahead),
+    )
 
 
 # ============================================================================
@@ -513,78 +700,69 @@ def get_upcoming_events(days_ahead: int = 30) -> list[dict]:
 # ============================================================================
 
 
-def get_all_tools() -> list:
+# The tool sets are fully static, so build them once at import time; the
+# accessors hand out the same tuples instead of rebuilding lists per call.
+
+_ALL_TOOLS = (
+    # Employee Info
+    search_employee,
+    get_employee_basic,
+    get_employee_tenure,
+    # Organization
+    get_manager,
+    get_direct_reports,
+    get_manager_chain,
+    get_team_overview,
+    get_department_directory,
+    get_org_chart,
+    # Time Off
+    get_holiday_balance,
+    get_holiday_requests,
+    submit_holiday_request,
+    cancel_holiday_request,
+    get_pending_approvals,
+    approve_holiday_request,
+    reject_holiday_request,
+    batch_holiday_action,
+    get_team_calendar,
+    # Compensation
+    get_compensation,
+    get_salary_history,
+    get_team_compensation_summary,
+    # Company Info
+    get_company_policies,
+    get_policy_details,
+    get_company_holidays,
+    get_announcements,
+    get_upcoming_events,
+)
+
+_CONFIRM_TOOLS = (
+    submit_holiday_request,
+    cancel_holiday_request,
+    approve_holiday_request,
+    reject_holiday_request,
+    batch_holiday_action,
+)
+
+_READ_ONLY_TOOLS = tuple(t for t in _ALL_TOOLS if t not in _CONFIRM_TOOLS)
+
+
+def get_all_tools() -> tuple:
     """Get all available HR tools for the agent."""
-    return [
-        # Employee Info
-        search_employee,
-        get_employee_basic,
-        get_employee_tenure,
-        # Organization
-        get_manager,
-        get_direct_reports,
-        get_manager_chain,
-        get_team_overview,
-        get_department_directory,
-        get_org_chart,
-        # Time Off
-        get_holiday_balance,
-        get_holiday_requests,
-        submit_holiday_request,
-        cancel_holiday_request,
-        get_pending_approvals,
-        approve_holiday_request,
-        reject_holiday_request,
-        get_team_calendar,
-        # Compensation
-        get_compensation,
-        get_salary_history,
-        get_team_compensation_summary,
-        # Company Info
-        get_company_policies,
-        get_policy_details,
-        get_company_holidays,
-        get_announcements,
-        get_upcoming_events,
-    ]
-
-
-def get_read_only_tools() -> list:
+    return _ALL_TOOLS
+
+
+def get_read_only_tools() -> tuple:
     """Get only read-only tools (no state-changing operations)."""
-    return [
-        search_employee,
-        get_employee_basic,
-        get_employee_tenure,
-        get_manager,
-        get_direct_reports,
-        get_manager_chain,
-        get_team_overview,
-        get_department_directory,
-        get_org_chart,
-        get_holiday_balance,
-        get_holiday_requests,
-        get_pending_approvals,
-        get_team_calendar,
-        get_compensation,
-        get_salary_history,
-        get_team_compensation_summary,
-        get_company_policies,
-        get_policy_details,
-        get_company_holidays,
-        get_announcements,
-        get_upcoming_events,
-    ]
-
-
-def get_tools_requiring_confirmation() -> list:
+    return _READ_ONLY_TOOLS
+
+
+def get_tools_requiring_confirmation() -> tuple:
     """Get tools that require human confirmation before execution."""
-    return [
-        submit_holiday_request,
-        cancel_holiday_request,
-        approve_holiday_request,
-        reject_holiday_request,
-    ]
+    return _CONFIRM_TOOLS
 
 
-# Tool name to function mapping for easy lookup
-TOOL_MAP = {tool.name: tool for tool in get_all_tools()}
+# Tool name to function mapping for easy lookup. Read-only: a proxy
+# keeps a stray registration from mutating the shared table.
+TOOL_MAP = MappingProxyType({tool.name: tool for tool in _ALL_TOOLS})
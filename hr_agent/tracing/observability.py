@@ -5,30 +5,54 @@ Provides structured logging, performance metrics, and distributed tracing
 for production monitoring and debugging.
 """
 
+import itertools
 import logging
+import os
+import random
+import secrets
+import sys
 import time
 import functools
+import uuid
+from collections import defaultdict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Callable
-from enum import Enum
 
 
 # ============================================================================
 # STRUCTURED LOGGING
 # ============================================================================
 
+# Emit records as JSON strings: handing the dict itself to logging means the
+# formatter falls back to str(dict), which is slow and not valid JSON.
+# orjson serializes several times faster than the stdlib when present.
+try:
+    import orjson
 
-class LogLevel(Enum):
-    DEBUG = "DEBUG"
-    INFO = "INFO"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
-    CRITICAL = "CRITICAL"
+    def _dumps(payload: dict) -> str:
+        return orjson.dumps(payload, default=str).decode()
 
+except ImportError:  # pragma: no cover - depends on environment
+    import json as _json
 
-@dataclass
+    def _dumps(payload: dict) -> str:
+        return _json.dumps(payload, default=str)
+
+
+# Interned once so per-record dict construction reuses the same key objects
+# instead of re-hashing fresh strings.
+_K_TS = sys.intern("ts_ns")
+_K_LEVEL = sys.intern("level")
+_K_MESSAGE = sys.intern("message")
+_K_REQUEST_ID = sys.intern("request_id")
+_K_USER_EMAIL = sys.intern("user_email")
+_K_SESSION_ID = sys.intern("session_id")
+_K_ACTION = sys.intern("action")
+
+
+@dataclass(slots=True)
 class LogContext:
     """Structured context for log entries."""
 
@@ -62,31 +86,40 @@ class StructuredLogger:
             else:
                 self._context.extra[key] = value
 
-    def _format_log(self, level: str, message: str, **kwargs) -> dict:
-        """Format log entry as structured JSON."""
-        return {
-            "timestamp": datetime.utcnow().isoformat(),
-            "level": level,
-            "message": message,
-            "request_id": self._context.request_id,
-            "user_email": self._context.user_email,
-            "session_id": self._context.session_id,
-            "action": self._context.action,
-            **self._context.extra,
-            **kwargs,
+    def _format_log(self, level: str, message: str, **kwargs) -> str:
+        """Format log entry as a structured JSON string."""
+        # time_ns() is a single C call; the sink can render it as ISO when
+        # (and only when) the record is actually emitted.
+        entry = {
+            _K_TS: time.time_ns(),
+            _K_LEVEL: level,
+            _K_MESSAGE: message,
+            _K_REQUEST_ID: self._context.request_id,
+            _K_USER_EMAIL: self._context.user_email,
+            _K_SESSION_ID: self._context.session_id,
+            _K_ACTION: self._context.action,
         }
+        if self._context.extra:
+            entry.update(self._context.extra)
+        if kwargs:
+            entry.update(kwargs)
+        return _dumps(entry)
 
     def info(self, message: str, **kwargs):
-        self.logger.info(self._format_log("INFO", message, **kwargs))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_log("INFO", message, **kwargs))
 
     def warning(self, message: str, **kwargs):
-        self.logger.warning(self._format_log("WARNING", message, **kwargs))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_log("WARNING", message, **kwargs))
 
     def error(self, message: str, **kwargs):
-        self.logger.error(self._format_log("ERROR", message, **kwargs))
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_log("ERROR", message, **kwargs))
 
     def debug(self, message: str, **kwargs):
-        self.logger.debug(self._format_log("DEBUG", message, **kwargs))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_log("DEBUG", message, **kwargs))
 
 
 # ============================================================================
@@ -94,7 +127,18 @@ class StructuredLogger:
 # ============================================================================
 
 
-@dataclass
+@functools.lru_cache(maxsize=4096)
+def _format_key(name: str, tag_items: frozenset) -> str:
+    """Build 'name[k=v,...]' once per distinct (name, tags) combination.
+
+    Instrumentation sites pass the same few tag dicts over and over, so
+    the sort-and-join work is cached instead of repeated per data point.
+    """
+    tag_str = ",".join(f"{k}={v}" for k, v in sorted(tag_items))
+    return f"{name}[{tag_str}]"
+
+
+@dataclass(frozen=True, slots=True)
 class MetricPoint:
     """A single metric data point."""
 
@@ -104,6 +148,53 @@ class MetricPoint:
     tags: dict = field(default_factory=dict)
 
 
+class _Histogram:
+    """Reservoir-sampled histogram with O(1) ingestion and bounded memory.
+
+    Exact min/max/avg/count are tracked as running aggregates; percentiles
+    are estimated from a fixed-size uniform sample (Vitter's algorithm R),
+    so a long-lived process never accumulates an unbounded value list.
+    """
+
+    RESERVOIR_SIZE = 1024
+
+    __slots__ = ("count", "total", "min", "max", "_reservoir")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._reservoir: list[float] = []
+
+    def record(self, value: float):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._reservoir) < self.RESERVOIR_SIZE:
+            self._reservoir.append(value)
+        else:
+            slot = random.randrange(self.count)
+            if slot < self.RESERVOIR_SIZE:
+                self._reservoir[slot] = value
+
+    def stats(self) -> dict:
+        sorted_vals = sorted(self._reservoir)
+        n = len(sorted_vals)
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "avg": self.total / self.count,
+            "p50": sorted_vals[n // 2],
+            "p95": sorted_vals[int(n * 0.95)] if n > 1 else sorted_vals[0],
+            "p99": sorted_vals[int(n * 0.99)] if n > 1 else sorted_vals[0],
+        }
+
+
 class MetricsCollector:
     """
     Collects and exposes metrics for monitoring.
@@ -116,21 +207,21 @@ class MetricsCollector:
     """
 
     def __init__(self):
-        self._counters: dict[str, int] = {}
-        self._histograms: dict[str, list[float]] = {}
+        self._counters: defaultdict[str, int] = defaultdict(int)
+        self._histograms: dict[str, _Histogram] = {}
         self._gauges: dict[str, float] = {}
 
     def increment(self, name: str, value: int = 1, tags: dict | None = None):
         """Increment a counter metric."""
-        key = self._make_key(name, tags)
-        self._counters[key] = self._counters.get(key, 0) + value
+        self._counters[self._make_key(name, tags)] += value
 
     def histogram(self, name: str, value: float, tags: dict | None = None):
         """Record a value in a histogram (for latency, etc.)."""
         key = self._make_key(name, tags)
-        if key not in self._histograms:
-            self._histograms[key] = []
-        self._histograms[key].append(value)
+        hist = self._histograms.get(key)
+        if hist is None:
+            hist = self._histograms[key] = _Histogram()
+        hist.record(value)
 
     def gauge(self, name: str, value: float, tags: dict | None = None):
         """Set a gauge metric (current value)."""
@@ -140,8 +231,7 @@ class MetricsCollector:
     def _make_key(self, name: str, tags: dict | None) -> str:
         if not tags:
             return name
-        tag_str = ",".join(f"{k}={v}" for k, v in sorted(tags.items()))
-        return f"{name}[{tag_str}]"
+        return _format_key(name, frozenset(tags.items()))
 
     def get_stats(self) -> dict:
         """Get current metric statistics."""
@@ -150,26 +240,9 @@ class MetricsCollector:
             "gauges": dict(self._gauges),
             "histograms": {},
         }
-        for key, values in self._histograms.items():
-            if values:
-                sorted_vals = sorted(values)
-                stats["histograms"][key] = {
-                    "count": len(values),
-                    "min": min(values),
-                    "max": max(values),
-                    "avg": sum(values) / len(values),
-                    "p50": sorted_vals[len(sorted_vals) // 2],
-                    "p95": (
-                        sorted_vals[int(len(sorted_vals) * 0.95)]
-                        if len(sorted_vals) > 1
-                        else sorted_vals[0]
-                    ),
-                    "p99": (
-                        sorted_vals[int(len(sorted_vals) * 0.99)]
-                        if len(sorted_vals) > 1
-                        else sorted_vals[0]
-                    ),
-                }
+        for key, hist in self._histograms.items():
+            if hist.count:
+                stats["histograms"][key] = hist.stats()
         return stats
 
 
@@ -178,7 +251,7 @@ class MetricsCollector:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class Span:
     """A trace span representing a unit of work."""
 
@@ -186,19 +259,32 @@ class Span:
     trace_id: str
     span_id: str
     parent_span_id: str | None
-    start_time: datetime
-    end_time: datetime | None = None
+    # Durations come from the monotonic clock: immune to NTP jumps, and
+    # the hot exit path is one int subtraction instead of datetime math.
+    # start_time is wall-clock purely so humans can read span records.
+    start_ns: int = field(default_factory=time.perf_counter_ns)
+    end_ns: int | None = None
+    start_time: datetime = field(default_factory=datetime.utcnow, init=False)
     tags: dict = field(default_factory=dict)
     events: list[dict] = field(default_factory=list)
     status: str = "OK"
 
     @property
     def duration_ms(self) -> float | None:
-        if self.end_time:
-            return (self.end_time - self.start_time).total_seconds() * 1000
+        if self.end_ns is not None:
+            return (self.end_ns - self.start_ns) / 1_000_000
         return None
 
 
+# Span IDs only need to be unique, not unguessable: a per-process random
+# prefix plus a counter is far cheaper than uuid4's urandom read + format.
+_PROC_TOKEN = secrets.token_hex(6)
+_next_span_seq = itertools.count().__next__
+
+# Retained span cap; old spans fall off the deque in O(1).
+_MAX_SPANS = int(os.environ.get("HR_AGENT_MAX_SPANS", "10000"))
+
+
 class Tracer:
     """
     Distributed tracing for request flows.
@@ -211,20 +297,19 @@ class Tracer:
     """
 
     def __init__(self):
-        self._spans: list[Span] = []
+        self._spans: deque[Span] = deque(maxlen=_MAX_SPANS)
         self._current_trace_id: str | None = None
 
     @contextmanager
     def span(self, name: str, tags: dict | None = None):
         """Create a traced span for a block of code."""
-        import uuid
-
         span = Span(
             name=name,
+            # Root spans still get a full uuid4 trace ID for correlation
+            # across processes; child spans inherit the current one.
             trace_id=self._current_trace_id or str(uuid.uuid4()),
-            span_id=str(uuid.uuid4()),
+            span_id=f"{_PROC_TOKEN}-{_next_span_seq():x}",
             parent_span_id=None,
-            start_time=datetime.utcnow(),
             tags=tags or {},
         )
 
@@ -236,41 +321,112 @@ class Tracer:
             span.events.append({"error": str(e), "type": type(e).__name__})
             raise
         finally:
-            span.end_time = datetime.utcnow()
+            span.end_ns = time.perf_counter_ns()
             self._spans.append(span)
 
     def get_recent_spans(self, limit: int = 100) -> list[Span]:
         """Get recent spans for debugging."""
-        return self._spans[-limit:]
+        start = max(0, len(self._spans) - limit)
+        return list(itertools.islice(self._spans, start, None))
 
 
 # ============================================================================
 # DECORATORS FOR EASY INSTRUMENTATION
 # ============================================================================
 
+# Observability switches, read once at import. When a facility is off the
+# decorators return the function unwrapped, so disabled instrumentation
+# costs nothing per call (common in tests and local dev).
+_OBS_ENABLED = os.environ.get("HR_AGENT_OBS", "1") != "0"
+_METRICS_ENABLED = _OBS_ENABLED and os.environ.get("HR_AGENT_METRICS", "1") != "0"
+_TRACING_ENABLED = _OBS_ENABLED and os.environ.get("HR_AGENT_TRACING", "1") != "0"
+
+
+def _adopt_identity(wrapper: Callable, func: Callable) -> Callable:
+    """Copy just the identity attributes the codebase relies on.
+
+    Cheaper at decoration time than functools.wraps, which also merges
+    __dict__ and copies annotations the wrappers never use.
+    """
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
 
 def timed(metric_name: str | None = None):
     """Decorator to measure function execution time."""
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        if not _METRICS_ENABLED:
+            return func
+
+        # Resolve names and bound methods once at decoration time; the
+        # per-call body is then two closure loads and two method calls.
+        name = metric_name or f"{func.__module__}.{func.__name__}"
+        dur_key = f"{name}.duration_ms"
+        ok_key = f"{name}.success"
+        err_key = f"{name}.error"
+        record_hist = metrics.histogram
+        inc = metrics.increment
+        clock = time.perf_counter_ns
+
         def wrapper(*args, **kwargs):
-            name = metric_name or f"{func.__module__}.{func.__name__}"
-            start = time.perf_counter()
+            start = clock()
             try:
                 result = func(*args, **kwargs)
-                metrics.histogram(
-                    f"{name}.duration_ms", (time.perf_counter() - start) * 1000
-                )
-                metrics.increment(f"{name}.success")
-                return result
             except Exception as e:
-                metrics.increment(
-                    f"{name}.error", tags={"error_type": type(e).__name__}
-                )
+                inc(err_key, tags={"error_type": type(e).__name__})
                 raise
+            record_hist(dur_key, (clock() - start) / 1e6)
+            inc(ok_key)
+            return result
 
-        return wrapper
+        return _adopt_identity(wrapper, func)
+
+    return decorator
+
+
+def observed(name: str | None = None):
+    """Decorator combining @timed and @traced in a single wrapper.
+
+    Stacking the two decorators costs an extra frame, a second clock
+    read, and a second tag dict on every call; this emits the span and
+    the metrics from one wrapper. Honors the same enablement flags, so
+    with observability off it returns the function untouched.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        if not _METRICS_ENABLED and not _TRACING_ENABLED:
+            return func
+        if not _TRACING_ENABLED:
+            return timed(name)(func)
+        if not _METRICS_ENABLED:
+            return traced(name)(func)
+
+        obs_name = name or f"{func.__module__}.{func.__name__}"
+        dur_key = f"{obs_name}.duration_ms"
+        ok_key = f"{obs_name}.success"
+        err_key = f"{obs_name}.error"
+        span = tracer.span
+        record_hist = metrics.histogram
+        inc = metrics.increment
+        clock = time.perf_counter_ns
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                with span(obs_name):
+                    result = func(*args, **kwargs)
+            except Exception as e:
+                inc(err_key, tags={"error_type": type(e).__name__})
+                raise
+            record_hist(dur_key, (clock() - start) / 1e6)
+            inc(ok_key)
+            return result
+
+        return _adopt_identity(wrapper, func)
 
     return decorator
 
@@ -279,13 +435,17 @@ def traced(span_name: str | None = None):
     """Decorator to create a trace span for a function."""
 
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
+        if not _TRACING_ENABLED:
+            return func
+
+        name = span_name or f"{func.__module__}.{func.__name__}"
+        span = tracer.span
+
         def wrapper(*args, **kwargs):
-            name = span_name or f"{func.__module__}.{func.__name__}"
-            with tracer.span(name):
+            with span(name):
                 return func(*args, **kwargs)
 
-        return wrapper
+        return _adopt_identity(wrapper, func)
 
     return decorator
 
@@ -1,12 +1,42 @@
+import threading
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from ..configs.config import settings
 
 _engine: Engine | None = None
+_engine_lock = threading.Lock()
+
+
+def _create_engine() -> Engine:
+    url = settings.db_url
+    kwargs: dict = {
+        "future": True,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+    if url.startswith("sqlite"):
+        # SQLite connections are cheap; just let the pool hand them across
+        # threads (every repository call opens its own transaction).
+        kwargs["connect_args"] = {"check_same_thread": False}
+    else:
+        kwargs.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            # LIFO keeps a small working set of warm connections busy and
+            # lets the rest age out via pool_recycle.
+            pool_use_lifo=True,
+        )
+    return create_engine(url, **kwargs)
 
 
 def get_engine() -> Engine:
     global _engine
     if _engine is None:
-        _engine = create_engine(settings.db_url, future=True)
+        # Double-checked locking: the unlocked fast path serves every call
+        # after startup, and the lock stops threaded workers from racing
+        # to build two engines (and two connection pools).
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
     return _engine
@@ -8,12 +8,16 @@ Production-grade error handling with:
 - Graceful degradation
 """
 
+import asyncio
+import random
+import threading
 import time
 import functools
 from enum import Enum
 from dataclasses import dataclass
 from typing import Callable, TypeVar, Any
-from datetime import datetime
+
+from ..tracing.observability import logger, metrics
 
 
 # ============================================================================
@@ -24,12 +28,16 @@ from datetime import datetime
 class HRAgentError(Exception):
     """Base exception for all HR Agent errors."""
 
+    # Subclasses override this once; every instance then shares the same
+    # interned code string instead of threading it through __init__.
+    _CODE = "UNKNOWN_ERROR"
+
     def __init__(
         self, message: str, code: str | None = None, details: dict | None = None
     ):
         super().__init__(message)
         self.message = message
-        self.code = code or "UNKNOWN_ERROR"
+        self.code = code or self._CODE
         self.details = details or {}
 
     def to_dict(self) -> dict:
@@ -43,12 +51,13 @@ class HRAgentError(Exception):
 class AuthorizationError(HRAgentError):
     """Raised when a user doesn't have permission for an action."""
 
+    _CODE = "AUTHORIZATION_DENIED"
+
     def __init__(
         self, message: str, action: str | None = None, user_email: str | None = None
     ):
         super().__init__(
             message,
-            code="AUTHORIZATION_DENIED",
             details={"action": action, "user_email": user_email},
         )
 
@@ -56,10 +65,11 @@ class AuthorizationError(HRAgentError):
 class ValidationError(HRAgentError):
     """Raised when input validation fails."""
 
+    _CODE = "VALIDATION_ERROR"
+
     def __init__(self, message: str, field: str | None = None, value: Any = None):
         super().__init__(
             message,
-            code="VALIDATION_ERROR",
             details={"field": field, "value": str(value) if value else None},
         )
 
@@ -67,10 +77,11 @@ class ValidationError(HRAgentError):
 class ResourceNotFoundError(HRAgentError):
     """Raised when a requested resource doesn't exist."""
 
+    _CODE = "RESOURCE_NOT_FOUND"
+
     def __init__(self, resource_type: str, resource_id: Any):
         super().__init__(
             f"{resource_type} with ID {resource_id} not found",
-            code="RESOURCE_NOT_FOUND",
             details={"resource_type": resource_type, "resource_id": str(resource_id)},
         )
 
@@ -78,10 +89,11 @@ class ResourceNotFoundError(HRAgentError):
 class ExternalServiceError(HRAgentError):
     """Raised when an external service call fails."""
 
+    _CODE = "EXTERNAL_SERVICE_ERROR"
+
     def __init__(self, service: str, message: str, status_code: int | None = None):
         super().__init__(
             f"{service} error: {message}",
-            code="EXTERNAL_SERVICE_ERROR",
             details={"service": service, "status_code": status_code},
         )
 
@@ -99,10 +111,11 @@ class LLMError(ExternalServiceError):
 class RateLimitError(HRAgentError):
     """Raised when rate limits are exceeded."""
 
+    _CODE = "RATE_LIMIT_EXCEEDED"
+
     def __init__(self, service: str, retry_after: int | None = None):
         super().__init__(
             f"Rate limit exceeded for {service}",
-            code="RATE_LIMIT_EXCEEDED",
             details={"service": service, "retry_after_seconds": retry_after},
         )
 
@@ -110,10 +123,11 @@ class RateLimitError(HRAgentError):
 class ConfigurationError(HRAgentError):
     """Raised when there's a configuration problem."""
 
+    _CODE = "CONFIGURATION_ERROR"
+
     def __init__(self, message: str, config_key: str | None = None):
         super().__init__(
             message,
-            code="CONFIGURATION_ERROR",
             details={"config_key": config_key},
         )
 
@@ -149,35 +163,39 @@ def retry_with_backoff(config: RetryConfig | None = None):
     """
     config = config or RetryConfig()
 
+    # The exponential schedule is fixed by the config, so compute each
+    # capped delay once here instead of doing ** and min() per retry.
+    base_delays = tuple(
+        min(
+            config.base_delay_seconds * (config.exponential_base**i),
+            config.max_delay_seconds,
+        )
+        for i in range(config.max_attempts)
+    )
+
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> T:
-            last_exception = None
+            # Happy path first: the overwhelming majority of calls
+            # succeed immediately and never set up the retry loop.
+            try:
+                return func(*args, **kwargs)
+            except config.retryable_exceptions as e:
+                last_exception = e
+
+            for attempt in range(1, config.max_attempts):
+                delay = base_delays[attempt - 1]
+                # Add jitter to prevent thundering herd
+                if config.jitter:
+                    delay *= 0.5 + random.random()
+
+                time.sleep(delay)
 
-            for attempt in range(1, config.max_attempts + 1):
                 try:
                     return func(*args, **kwargs)
                 except config.retryable_exceptions as e:
                     last_exception = e
 
-                    if attempt == config.max_attempts:
-                        break
-
-                    # Calculate delay with exponential backoff
-                    delay = min(
-                        config.base_delay_seconds
-                        * (config.exponential_base ** (attempt - 1)),
-                        config.max_delay_seconds,
-                    )
-
-                    # Add jitter to prevent thundering herd
-                    if config.jitter:
-                        import random
-
-                        delay = delay * (0.5 + random.random())
-
-                    time.sleep(delay)
-
             raise last_exception
 
         return wrapper
@@ -222,61 +240,101 @@ class CircuitBreaker:
         self._state = CircuitState.CLOSED
         self._failure_count = 0
         self._success_count = 0
-        self._last_failure_time: datetime | None = None
+        # Monotonic float: the open->half-open timeout can't be skewed by
+        # wall-clock adjustments, and reading it allocates nothing.
+        self._last_failure_time: float | None = None
+        # Guards counter updates and state transitions; the closed-state
+        # read path below never takes it.
+        self._lock = threading.Lock()
 
     @property
     def state(self) -> CircuitState:
-        if self._state == CircuitState.OPEN:
-            # Check if timeout has passed
-            if self._last_failure_time:
-                elapsed = (datetime.utcnow() - self._last_failure_time).total_seconds()
-                if elapsed >= self.config.timeout_seconds:
-                    self._state = CircuitState.HALF_OPEN
-                    self._success_count = 0
+        state = self._state
+        if state is CircuitState.CLOSED:
+            # Fast path: nearly all reads, lock-free.
+            return state
+        if state is CircuitState.OPEN:
+            last = self._last_failure_time
+            if (
+                last is not None
+                and time.monotonic() - last >= self.config.timeout_seconds
+            ):
+                with self._lock:
+                    # Re-check under the lock; another thread may have
+                    # transitioned first.
+                    if self._state is CircuitState.OPEN:
+                        self._state = CircuitState.HALF_OPEN
+                        self._success_count = 0
         return self._state
 
     def record_success(self):
         """Record a successful call."""
-        if self.state == CircuitState.HALF_OPEN:
-            self._success_count += 1
-            if self._success_count >= self.config.success_threshold:
-                self._state = CircuitState.CLOSED
-                self._failure_count = 0
-        elif self.state == CircuitState.CLOSED:
-            self._failure_count = 0
+        if self.state is CircuitState.HALF_OPEN:
+            with self._lock:
+                self._success_count += 1
+                if self._success_count >= self.config.success_threshold:
+                    self._state = CircuitState.CLOSED
+                    self._failure_count = 0
+        elif self._failure_count:
+            with self._lock:
+                if self._state is CircuitState.CLOSED:
+                    self._failure_count = 0
 
     def record_failure(self):
         """Record a failed call."""
-        self._failure_count += 1
-        self._last_failure_time = datetime.utcnow()
+        with self._lock:
+            self._failure_count += 1
+            self._last_failure_time = time.monotonic()
 
-        if self.state == CircuitState.HALF_OPEN:
-            self._state = CircuitState.OPEN
-        elif self._failure_count >= self.config.failure_threshold:
-            self._state = CircuitState.OPEN
+            if self._state is CircuitState.HALF_OPEN:
+                self._state = CircuitState.OPEN
+            elif self._failure_count >= self.config.failure_threshold:
+                self._state = CircuitState.OPEN
 
     def allow_request(self) -> bool:
         """Check if a request should be allowed."""
-        return self.state != CircuitState.OPEN
+        return self.state is not CircuitState.OPEN
 
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
         """Use as a decorator."""
+        # Bind the hot attributes once so the wrapper body runs on
+        # LOAD_FAST closure lookups instead of per-call self traversal.
+        allow = self.allow_request
+        success = self.record_success
+        failure = self.record_failure
+        monitored = self.config.monitored_exceptions
+        open_msg = f"Circuit breaker is open for {self.name}"
+        name = self.name
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs) -> T:
+                if not allow():
+                    raise ExternalServiceError(name, open_msg)
 
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            if not self.allow_request():
-                raise ExternalServiceError(
-                    self.name,
-                    f"Circuit breaker is open for {self.name}",
-                )
+                try:
+                    result = await func(*args, **kwargs)
+                except monitored:
+                    failure()
+                    raise
+                success()
+                return result
 
-            try:
-                result = func(*args, **kwargs)
-                self.record_success()
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs) -> T:
+                if not allow():
+                    raise ExternalServiceError(name, open_msg)
+
+                try:
+                    result = func(*args, **kwargs)
+                except monitored:
+                    failure()
+                    raise
+                success()
                 return result
-            except self.config.monitored_exceptions:
-                self.record_failure()
-                raise
 
         return wrapper
 
@@ -286,6 +344,11 @@ class CircuitBreaker:
 # ============================================================================
 
 
+# Failure modes worth degrading gracefully on; programming errors such as
+# TypeError still propagate instead of being silently replaced.
+_FALLBACK_EXCEPTIONS = (HRAgentError, TimeoutError, ConnectionError)
+
+
 def with_fallback(fallback_value: T | Callable[..., T]):
     """
     Decorator that returns a fallback value on error.
@@ -295,16 +358,47 @@ def with_fallback(fallback_value: T | Callable[..., T]):
         def get_announcements():
             return api.fetch_announcements()
     """
+    # Branch on the fallback kind and on sync vs async once here, so
+    # each call runs a specialized wrapper with no callable() check.
+    fallback_is_callable = callable(fallback_value)
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> T:
-            try:
-                return func(*args, **kwargs)
-            except Exception:
-                if callable(fallback_value):
+        if asyncio.iscoroutinefunction(func):
+            if fallback_is_callable:
+
+                @functools.wraps(func)
+                async def wrapper(*args, **kwargs) -> T:
+                    try:
+                        return await func(*args, **kwargs)
+                    except _FALLBACK_EXCEPTIONS:
+                        return fallback_value(*args, **kwargs)
+
+            else:
+
+                @functools.wraps(func)
+                async def wrapper(*args, **kwargs) -> T:
+                    try:
+                        return await func(*args, **kwargs)
+                    except _FALLBACK_EXCEPTIONS:
+                        return fallback_value
+
+        elif fallback_is_callable:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs) -> T:
+                try:
+                    return func(*args, **kwargs)
+                except _FALLBACK_EXCEPTIONS:
                     return fallback_value(*args, **kwargs)
-                return fallback_value
+
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs) -> T:
+                try:
+                    return func(*args, **kwargs)
+                except _FALLBACK_EXCEPTIONS:
+                    return fallback_value
 
         return wrapper
 
@@ -335,8 +429,6 @@ class ErrorContext:
     def __exit__(self, exc_type, exc_val, exc_tb):
         if exc_type is not None:
             # Log the error with context
-            from ..tracing.observability import logger, metrics
-
             logger.error(
                 f"Error during {self.operation}",
                 error_type=exc_type.__name__,
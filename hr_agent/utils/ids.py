@@ -0,0 +1,28 @@
+"""
+ID Generation
+
+Time-ordered UUIDv7 identifiers (RFC 9562), generated with the standard
+library. Unlike uuid4, the leading 48 bits are a Unix-millisecond
+timestamp, so IDs created later sort later: B-tree indexes over session
+and request IDs append at the rightmost page instead of fragmenting
+across random pages.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7.
+
+    Layout per RFC 9562: 48-bit Unix-ms timestamp, 4-bit version,
+    12 random bits, 2-bit variant, 62 random bits.
+    """
+    unix_ms = (time.time_ns() // 1_000_000) & 0xFFFFFFFFFFFF
+    rand = os.urandom(10)
+    rand_a = ((rand[0] << 8) | rand[1]) & 0x0FFF
+    rand_b = int.from_bytes(rand[2:], "big") & 0x3FFFFFFFFFFFFFFF
+    return uuid.UUID(
+        int=(unix_ms << 80) | (0x7 << 76) | (rand_a << 64) | (0b10 << 62) | rand_b
+    )
@@ -14,6 +14,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 
 
 # ============================================================================
@@ -161,8 +162,17 @@ class AuditLogger:
     - Implement tamper detection
     """
 
+    # Identical entries within this window are counted, not re-appended:
+    # a chatty frontend logs LOGIN on every request, which would
+    # otherwise produce hundreds of duplicate rows per user per minute.
+    _DEDUP_WINDOW_NS = 1_000_000_000
+    _MAX_ENTRIES = 10_000
+    _RECENT_MAX = 1_024
+
     def __init__(self):
         self._entries: list[AuditEntry] = []
+        # Dedup slots: identity key -> (window start ns, entry)
+        self._recent: dict[tuple, tuple[int, AuditEntry]] = {}
 
     def log(
         self,
@@ -175,7 +185,23 @@ class AuditLogger:
         user_agent: str | None = None,
         success: bool = True,
     ):
-        """Log an audit entry."""
+        """Log an audit entry.
+
+        Repeats of the same entry inside the dedup window bump a count on
+        the existing row instead of appending. Entries carrying distinct
+        details are never merged.
+        """
+        now_ns = time.monotonic_ns()
+
+        if not details:
+            key = (action, user_email, resource_type, resource_id, ip_address, success)
+            slot = self._recent.get(key)
+            if slot is not None and now_ns - slot[0] < self._DEDUP_WINDOW_NS:
+                slot[1].details["count"] = slot[1].details.get("count", 1) + 1
+                return
+        else:
+            key = None
+
         entry = AuditEntry(
             timestamp=datetime.utcnow(),
             action=action,
@@ -189,6 +215,18 @@ class AuditLogger:
         )
         self._entries.append(entry)
 
+        # Bound memory: drop the oldest entries and expired dedup slots.
+        if len(self._entries) > self._MAX_ENTRIES:
+            del self._entries[: len(self._entries) - self._MAX_ENTRIES]
+        if key is not None:
+            if len(self._recent) >= self._RECENT_MAX:
+                self._recent = {
+                    k: v
+                    for k, v in self._recent.items()
+                    if now_ns - v[0] < self._DEDUP_WINDOW_NS
+                }
+            self._recent[key] = (now_ns, entry)
+
         # In production, also write to persistent storage
         # self._persist_entry(entry)
 
@@ -260,13 +298,13 @@ class SensitiveDataType(Enum):
     DISCIPLINARY = "disciplinary"
 
 
-# Actions that access sensitive data
-SENSITIVE_ACTIONS = {
+# Actions that access sensitive data (read-only shared table)
+SENSITIVE_ACTIONS = MappingProxyType({
     "get_compensation": SensitiveDataType.COMPENSATION,
     "get_salary_history": SensitiveDataType.COMPENSATION,
     "get_team_compensation_summary": SensitiveDataType.COMPENSATION,
     "get_performance_review": SensitiveDataType.PERFORMANCE,
-}
+})
 
 
 def is_sensitive_action(action: str) -> bool:
@@ -4,10 +4,23 @@ from datetime import datetime
 
 from fastapi.testclient import TestClient
 
-from apps.api import server
 from apps.api.server import app, get_current_user
 
 
+class _FakeSessionRepo:
+    """In-memory stand-in for the DB-backed session repository."""
+
+    def __init__(self):
+        self.sessions: dict[str, dict] = {}
+        self.turns: dict[str, list[dict]] = {}
+
+    def get(self, session_id: str) -> dict | None:
+        return self.sessions.get(session_id)
+
+    def list_turns(self, session_id: str) -> list[dict]:
+        return self.turns.get(session_id, [])
+
+
 def _override_user():
     return {
         "employee_id": 201,
@@ -32,26 +45,34 @@ def _override_other_user():
     }
 
 
-def test_session_turns_history_endpoint():
-    app.dependency_overrides[get_current_user] = _override_user
-    server._sessions.clear()
-    server._sessions["session-1"] = {
+def _seeded_repo() -> _FakeSessionRepo:
+    repo = _FakeSessionRepo()
+    repo.sessions["session-1"] = {
+        "session_id": "session-1",
         "user_email": "alex.kim@acme.com",
-        "created_at": datetime.utcnow(),
-        "turns": [
-            {
-                "query": "How many leave days do I have?",
-                "response": "You have 18 days remaining.",
-                "timestamp": "2026-03-13T09:00:00",
-            },
-            {
-                "query": "Can I carry over days?",
-                "response": "Yes, up to 5 days can be carried over.",
-                "timestamp": "2026-03-13T09:01:00",
-            },
-        ],
+        "created_at": datetime.utcnow().isoformat(),
         "pending_confirmation": None,
+        "turn_count": 2,
+        "first_query": "How many leave days do I have?",
     }
+    repo.turns["session-1"] = [
+        {
+            "query": "How many leave days do I have?",
+            "response": "You have 18 days remaining.",
+            "created_at": "2026-03-13T09:00:00",
+        },
+        {
+            "query": "Can I carry over days?",
+            "response": "Yes, up to 5 days can be carried over.",
+            "created_at": "2026-03-13T09:01:00",
+        },
+    ]
+    return repo
+
+
+def test_session_turns_history_endpoint(monkeypatch):
+    app.dependency_overrides[get_current_user] = _override_user
+    monkeypatch.setattr("apps.api.server._session_repo", _seeded_repo())
 
     with TestClient(app) as client:
         response = client.get("/sessions/session-1/turns")
@@ -62,17 +83,10 @@ def test_session_turns_history_endpoint():
         assert payload[1]["response"] == "Yes, up to 5 days can be carried over."
 
     app.dependency_overrides.clear()
-    server._sessions.clear()
 
 
-def test_session_turns_forbidden_and_not_found():
-    server._sessions.clear()
-    server._sessions["session-1"] = {
-        "user_email": "alex.kim@acme.com",
-        "created_at": datetime.utcnow(),
-        "turns": [],
-        "pending_confirmation": None,
-    }
+def test_session_turns_forbidden_and_not_found(monkeypatch):
+    monkeypatch.setattr("apps.api.server._session_repo", _seeded_repo())
 
     app.dependency_overrides[get_current_user] = _override_other_user
     with TestClient(app) as client:
@@ -83,4 +97,3 @@ def test_session_turns_forbidden_and_not_found():
         assert missing.status_code == 404
 
     app.dependency_overrides.clear()
-    server._sessions.clear()
@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from langchain_core.messages import AIMessage, ToolMessage
+from sqlalchemy import create_engine, text
+
+from hr_agent.agent import langgraph_agent
+from hr_agent.repositories.holiday import HolidayRepository
+from hr_agent.services.base import HolidayService
+
+
+def _batch_call_state(user_id: int, role: str) -> dict:
+    tool_call = {
+        "name": "batch_holiday_action",
+        "args": {
+            "manager_employee_id": user_id,
+            "actions": [
+                {"request_id": 12, "action": "approve"},
+                {"request_id": 15, "action": "reject", "reason": "Coverage"},
+            ],
+        },
+        "id": "tc-batch-1",
+    }
+    return {
+        "messages": [AIMessage(content="", tool_calls=[tool_call])],
+        "user_email": "amanda.foster@acme.com",
+        "user_id": user_id,
+        "user_role": role,
+        "tools_called": [],
+        "current_date": "2026-08-26",
+    }
+
+
+class _FakeHolidayService:
+    def __init__(self):
+        self.calls = []
+
+    def review_requests(self, manager_id: int, actions: list[dict]) -> dict:
+        self.calls.append((manager_id, actions))
+        return {
+            "success": True,
+            "results": [
+                {"request_id": a["request_id"], "success": True} for a in actions
+            ],
+        }
+
+
+def test_manager_batch_action_is_authorized_and_executes(monkeypatch):
+    state = _batch_call_state(103, "MANAGER")
+
+    # No denial message means authorization passed.
+    assert langgraph_agent.check_authorization(state) == {}
+
+    fake = _FakeHolidayService()
+    monkeypatch.setattr(
+        "hr_agent.tools.langchain_tools.get_holiday_service", lambda: fake
+    )
+
+    result = langgraph_agent.tool_node(state)
+
+    (message,) = result["messages"]
+    assert isinstance(message, ToolMessage)
+    assert message.tool_call_id == "tc-batch-1"
+    assert "Access Denied" not in message.content
+    assert '"success":true' in message.content.replace(" ", "").lower()
+    assert result["tools_called"] == ["batch_holiday_action"]
+    expected_actions = state["messages"][0].tool_calls[0]["args"]["actions"]
+    assert fake.calls == [(103, expected_actions)]
+
+
+def test_manager_cannot_batch_review_as_another_manager():
+    state = _batch_call_state(103, "MANAGER")
+    # Point the tool at a different manager's id than the requester's.
+    state["messages"][0].tool_calls[0]["args"]["manager_employee_id"] = 112
+
+    result = langgraph_agent.check_authorization(state)
+
+    (denial,) = result["messages"]
+    assert isinstance(denial, ToolMessage)
+    assert "Access Denied" in denial.content
+
+
+def test_employee_batch_action_is_denied():
+    state = _batch_call_state(201, "EMPLOYEE")
+
+    result = langgraph_agent.check_authorization(state)
+
+    (denial,) = result["messages"]
+    assert isinstance(denial, ToolMessage)
+    assert denial.tool_call_id == "tc-batch-1"
+    assert "Access Denied" in denial.content
+
+
+class _TestHolidayRepository(HolidayRepository):
+    def __init__(self, engine):
+        self._engine = engine
+
+    def _get_engine(self):
+        return self._engine
+
+
+def _build_holiday_engine(tmp_path: Path):
+    db_path = tmp_path / "holiday_test.db"
+    engine = create_engine(f"sqlite:///{db_path}", future=True)
+    with engine.begin() as con:
+        con.execute(
+            text(
+                """
+                CREATE TABLE employee (
+                    employee_id INTEGER PRIMARY KEY,
+                    preferred_name TEXT NOT NULL
+                )
+                """
+            )
+        )
+        con.execute(
+            text(
+                """
+                CREATE TABLE manager_reports (
+                    manager_employee_id INTEGER NOT NULL,
+                    report_employee_id INTEGER NOT NULL
+                )
+                """
+            )
+        )
+        con.execute(
+            text(
+                """
+                CREATE TABLE holiday_request (
+                    request_id INTEGER PRIMARY KEY,
+                    employee_id INTEGER NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    days REAL NOT NULL,
+                    status TEXT NOT NULL,
+                    reason TEXT NULL,
+                    requested_at TEXT NOT NULL,
+                    reviewed_by INTEGER NULL,
+                    reviewed_at TEXT NULL,
+                    rejection_reason TEXT NULL
+                )
+                """
+            )
+        )
+        con.execute(
+            text(
+                """
+                INSERT INTO employee VALUES
+                (103, 'Amanda'), (112, 'James'), (201, 'Alex'), (212, 'Emma')
+                """
+            )
+        )
+        # Alex and Emma report to Amanda (103); James (112) manages nobody
+        # relevant here, so request 14 below sits outside Amanda's team.
+        con.execute(
+            text(
+                """
+                INSERT INTO manager_reports VALUES
+                (103, 201), (103, 212), (112, 150)
+                """
+            )
+        )
+        con.execute(
+            text(
+                """
+                INSERT INTO holiday_request
+                    (request_id, employee_id, start_date, end_date, days,
+                     status, reason, requested_at)
+                VALUES
+                (11, 201, '2026-09-07', '2026-09-11', 5, 'PENDING', NULL,
+                 '2026-08-01T09:00:00Z'),
+                (12, 212, '2026-09-14', '2026-09-15', 2, 'PENDING', NULL,
+                 '2026-08-02T09:00:00Z'),
+                (13, 201, '2026-07-01', '2026-07-03', 3, 'APPROVED', NULL,
+                 '2026-06-01T09:00:00Z'),
+                (14, 150, '2026-09-21', '2026-09-22', 2, 'PENDING', NULL,
+                 '2026-08-03T09:00:00Z')
+                """
+            )
+        )
+    return engine
+
+
+def test_review_requests_against_seeded_repository(tmp_path: Path):
+    repo = _TestHolidayRepository(_build_holiday_engine(tmp_path))
+    service = HolidayService()
+    service.repo = repo
+
+    result = service.review_requests(
+        103,
+        [
+            {"request_id": 11, "action": "approve"},
+            {"request_id": 12, "action": "reject", "reason": "Coverage"},
+            {"request_id": 13, "action": "approve"},  # already reviewed
+            {"request_id": 14, "action": "approve"},  # another manager's report
+            {"request_id": 99, "action": "approve"},  # unknown id
+            {"request_id": 11, "action": "reject"},  # duplicate in one batch
+        ],
+    )
+
+    assert result["success"] is True
+    assert result["message"] == "Applied 2 of 6 holiday actions."
+
+    approved, rejected, already, foreign, unknown, duplicate = result["results"]
+    assert approved == {
+        "request_id": 11,
+        "success": True,
+        "message": "Holiday request for Alex has been approved.",
+    }
+    assert rejected == {
+        "request_id": 12,
+        "success": True,
+        "message": "Holiday request for Emma has been rejected.",
+    }
+    assert already == {
+        "request_id": 13,
+        "success": False,
+        "error": "Request is already APPROVED.",
+    }
+    # The managership filter in the IN query hides other teams' requests,
+    # so they are indistinguishable from ids that don't exist at all.
+    for outcome in (foreign, unknown):
+        assert outcome["success"] is False
+        assert outcome["error"] == "Request not found or you're not the manager."
+    assert duplicate == {
+        "request_id": 11,
+        "success": False,
+        "error": "Request is already APPROVED.",
+    }
+
+    with repo._get_engine().begin() as con:
+        rows = {
+            r["request_id"]: dict(r)
+            for r in con.execute(
+                text(
+                    """SELECT request_id, status, reviewed_by, reviewed_at,
+                              rejection_reason
+                       FROM holiday_request"""
+                )
+            ).mappings()
+        }
+
+    assert rows[11]["status"] == "APPROVED"
+    assert rows[11]["reviewed_by"] == 103
+    assert rows[11]["reviewed_at"] is not None
+    assert rows[11]["rejection_reason"] is None
+    assert rows[12]["status"] == "REJECTED"
+    assert rows[12]["reviewed_by"] == 103
+    assert rows[12]["rejection_reason"] == "Coverage"
+    # Untouched by the batched UPDATE.
+    assert rows[13]["reviewed_by"] is None
+    assert rows[14]["status"] == "PENDING"
+    assert rows[14]["reviewed_by"] is None
+
+
+def test_review_requests_rejects_malformed_actions(tmp_path: Path):
+    repo = _TestHolidayRepository(_build_holiday_engine(tmp_path))
+    service = HolidayService()
+    service.repo = repo
+
+    result = service.review_requests(
+        103, [{"request_id": 11, "action": "escalate"}]
+    )
+
+    assert result == {
+        "success": False,
+        "error": "Each action needs a request_id and an action of 'approve' or 'reject'.",
+    }
+    with repo._get_engine().begin() as con:
+        status = con.execute(
+            text("SELECT status FROM holiday_request WHERE request_id=11")
+        ).scalar_one()
+    assert status == "PENDING"